@@ -2,6 +2,7 @@
 
 import tkinter as tk
 from tkinter import ttk
+import functools
 import json
 import subprocess
 import sys
@@ -15,7 +16,8 @@ class BrightnessControlGUI:
     def __init__(self):
         self.config_path = "/home/user/Documents/auto-brightness/config.json"
         self.config = self.load_config()
-        
+        self._reset_id = None  # pending "Ready" reset timer, cancelled on restack
+
         # Create main window
         self.root = tk.Tk()
         self.root.title("Auto Brightness & Monitor Control v2.0 (Enhanced)")
@@ -101,9 +103,10 @@ class BrightnessControlGUI:
         # Min brightness slider
         ttk.Label(main_frame, text="Night Brightness:").grid(row=3, column=0, sticky=tk.W, pady=5)
         self.min_var = tk.DoubleVar(value=self.config.get("min_brightness", 0.3) * 100)
-        self.min_scale = ttk.Scale(main_frame, from_=10, to=80, 
+        self.min_var.trace_add('write', lambda *_: self._on_min_var_write())
+        self.min_scale = ttk.Scale(main_frame, from_=10, to=80,
                                   variable=self.min_var, orient=tk.HORIZONTAL,
-                                  length=200, command=self.on_min_change)
+                                  length=200)
         self.min_scale.grid(row=3, column=1, padx=(10, 0), pady=5)
         
         self.min_label = ttk.Label(main_frame, text=f"{int(self.min_var.get())}%")
@@ -112,9 +115,10 @@ class BrightnessControlGUI:
         # Max brightness slider  
         ttk.Label(main_frame, text="Day Brightness:").grid(row=4, column=0, sticky=tk.W, pady=5)
         self.max_var = tk.DoubleVar(value=self.config.get("max_brightness", 1.0) * 100)
+        self.max_var.trace_add('write', lambda *_: self._on_max_var_write())
         self.max_scale = ttk.Scale(main_frame, from_=50, to=100,
-                                  variable=self.max_var, orient=tk.HORIZONTAL, 
-                                  length=200, command=self.on_max_change)
+                                  variable=self.max_var, orient=tk.HORIZONTAL,
+                                  length=200)
         self.max_scale.grid(row=4, column=1, padx=(10, 0), pady=5)
         
         self.max_label = ttk.Label(main_frame, text=f"{int(self.max_var.get())}%")
@@ -142,15 +146,28 @@ class BrightnessControlGUI:
         style.configure('Success.TLabel', foreground=status_colors['success'])
         self.status_label.configure(style='Success.TLabel')
         
-        # Monitor control panel tab
-        monitor_frame = ttk.Frame(self.notebook)
-        self.notebook.add(monitor_frame, text="Monitor Control")
-        
-        # Embed the monitor control GUI
-        self.monitor_control_gui = MonitorControlGUI(monitor_frame)
-        
+        # Monitor control panel tab - built lazily on first visit since
+        # MonitorControlGUI probes monitors over DDC/CI (can take >1s)
+        self.monitor_frame = ttk.Frame(self.notebook)
+        self.notebook.add(self.monitor_frame, text="Monitor Control")
+        self.monitor_control_gui = None
+        self.notebook.bind('<<NotebookTabChanged>>', self._on_tab_changed)
+
         # Apply theme to all newly created widgets
         plasma_theme.apply_to_window(self.root)
+
+    def _on_tab_changed(self, event):
+        """Build the Monitor Control tab the first time the user opens it"""
+        if self.monitor_control_gui is not None:
+            return
+        if self.notebook.index('current') != self.notebook.index(self.monitor_frame):
+            return
+
+        # Embed the monitor control GUI
+        self.monitor_control_gui = MonitorControlGUI(self.monitor_frame)
+
+        # Apply theme to the newly created widgets
+        plasma_theme.apply_to_window(self.root)
     
     def on_auto_brightness_toggle(self):
         """Handle auto-brightness enable/disable toggle"""
@@ -177,21 +194,19 @@ class BrightnessControlGUI:
             self.latitude_entry.configure(state='disabled')
             self.longitude_entry.configure(state='disabled')
         
-    def on_min_change(self, value):
-        val = int(float(value))
+    def _on_min_var_write(self):
+        val = int(self.min_var.get())
         self.min_label.config(text=f"{val}%")
         # Ensure min doesn't exceed max
         if val >= self.max_var.get():
             self.max_var.set(val + 10)
-            self.max_label.config(text=f"{int(self.max_var.get())}%")
-    
-    def on_max_change(self, value):
-        val = int(float(value))
+
+    def _on_max_var_write(self):
+        val = int(self.max_var.get())
         self.max_label.config(text=f"{val}%")
         # Ensure max doesn't go below min
         if val <= self.min_var.get():
             self.min_var.set(val - 10)
-            self.min_label.config(text=f"{int(self.min_var.get())}%")
     
     def apply_settings(self):
         # Use theme colors for status
@@ -201,7 +216,7 @@ class BrightnessControlGUI:
         
         self.status_label.config(text="Applying settings...")
         self.status_label.configure(style='Warning.TLabel')
-        self.root.update()
+        self.root.update_idletasks()
         
         # Update config
         self.config["min_brightness"] = self.min_var.get() / 100
@@ -247,39 +262,40 @@ class BrightnessControlGUI:
         
         self.status_label.config(text="Restarting service...")
         self.status_label.configure(style='Warning.TLabel')
-        self.root.update()
+        self.root.update_idletasks()
         threading.Thread(target=self._restart_service_thread, daemon=True).start()
     
+    def _set_status(self, text, style):
+        """Update the status label text and style in one main-thread dispatch"""
+        self.status_label.config(text=text)
+        self.status_label.configure(style=style)
+
     def _restart_service_thread(self):
         try:
-            subprocess.run(['systemctl', '--user', 'restart', 'auto-brightness.service'], 
+            subprocess.run(['systemctl', '--user', 'restart', 'auto-brightness.service'],
                          check=True, capture_output=True)
-            
+
             # Update status on main thread with theme colors
             status_colors = plasma_theme.get_status_colors()
             style = ttk.Style()
             style.configure('Success.TLabel', foreground=status_colors['success'])
-            
-            self.root.after(0, lambda: [
-                self.status_label.config(text="Settings applied successfully!"),
-                self.status_label.configure(style='Success.TLabel')
-            ])
-            
-            # Clear status after 3 seconds
-            self.root.after(3000, lambda: [
-                self.status_label.config(text="Ready"),
-                self.status_label.configure(style='Success.TLabel')
-            ])
-                
+
+            self.root.after(0, functools.partial(
+                self._set_status, "Settings applied successfully!", "Success.TLabel"))
+
+            # Clear status after 3 seconds, replacing any reset already queued
+            if self._reset_id is not None:
+                self.root.after_cancel(self._reset_id)
+            self._reset_id = self.root.after(3000, functools.partial(
+                self._set_status, "Ready", "Success.TLabel"))
+
         except subprocess.CalledProcessError as e:
             status_colors = plasma_theme.get_status_colors()
             style = ttk.Style()
             style.configure('Error.TLabel', foreground=status_colors['error'])
-            
-            self.root.after(0, lambda: [
-                self.status_label.config(text="Error restarting service"),
-                self.status_label.configure(style='Error.TLabel')
-            ])
+
+            self.root.after(0, functools.partial(
+                self._set_status, "Error restarting service", "Error.TLabel"))
     
     def run(self):
         self.root.mainloop()
@@ -30,6 +30,12 @@ class BrightnessController(QObject):
         self.refresh_timer = QTimer()
         self.refresh_timer.timeout.connect(self.refresh_monitors)
         self.refresh_timer.start(10000)  # Refresh every 10 seconds
+
+        # Coalesce rapid slider updates into one DDC write per monitor/feature.
+        # DDC/CI mandates >50ms between writes, so a 50ms debounce keeps us
+        # within spec while dropping intermediate values during drags.
+        self._pending_writes = {}
+        self._write_timers = {}
         
         # Initial monitor detection
         threading.Thread(target=self._detect_monitors_thread, daemon=True).start()
@@ -171,27 +177,51 @@ class BrightnessController(QObject):
         if self._current_monitor:
             self.statusChanged.emit(f"Selected: {self._current_monitor['model']}", "info")
     
-    @pyqtSlot(str, int)
-    def setMonitorBrightness(self, monitor_id, brightness):
-        """Set monitor brightness"""
+    def _queue_vcp_write(self, monitor_id, kind, value):
+        """Store the latest value for a monitor/feature and (re)arm its debounce timer"""
+        key = (monitor_id, kind)
+        self._pending_writes[key] = value
+        timer = self._write_timers.get(key)
+        if timer is None:
+            timer = QTimer(self)
+            timer.setSingleShot(True)
+            timer.setInterval(50)
+            timer.timeout.connect(lambda k=key: self._flush_vcp_write(k))
+            self._write_timers[key] = timer
+        if not timer.isActive():
+            timer.start()
+
+    def _flush_vcp_write(self, key):
+        """Issue one DDC write for the most recent queued value"""
+        monitor_id, kind = key
+        value = self._pending_writes.pop(key, None)
+        if value is None:
+            return
         monitor = self._monitors.get(monitor_id)
-        if monitor and monitor['i2c_bus']:
-            success = self.monitor_control.set_brightness(monitor['i2c_bus'], brightness)
+        if not (monitor and monitor['i2c_bus']):
+            return
+        if kind == 'brightness':
+            success = self.monitor_control.set_brightness(monitor['i2c_bus'], value)
             if success:
-                self.statusChanged.emit(f"Brightness set to {brightness}%", "success")
+                self.statusChanged.emit(f"Brightness set to {value}%", "success")
             else:
                 self.statusChanged.emit("Failed to set brightness", "error")
-    
-    @pyqtSlot(str, int)
-    def setMonitorContrast(self, monitor_id, contrast):
-        """Set monitor contrast"""
-        monitor = self._monitors.get(monitor_id)
-        if monitor and monitor['i2c_bus']:
-            success = self.monitor_control.set_contrast(monitor['i2c_bus'], contrast)
+        elif kind == 'contrast':
+            success = self.monitor_control.set_contrast(monitor['i2c_bus'], value)
             if success:
-                self.statusChanged.emit(f"Contrast set to {contrast}%", "success")
+                self.statusChanged.emit(f"Contrast set to {value}%", "success")
             else:
                 self.statusChanged.emit("Failed to set contrast", "error")
+
+    @pyqtSlot(str, int)
+    def setMonitorBrightness(self, monitor_id, brightness):
+        """Set monitor brightness (debounced)"""
+        self._queue_vcp_write(monitor_id, 'brightness', brightness)
+
+    @pyqtSlot(str, int)
+    def setMonitorContrast(self, monitor_id, contrast):
+        """Set monitor contrast (debounced)"""
+        self._queue_vcp_write(monitor_id, 'contrast', contrast)
     
     @pyqtSlot(str, str)
     def setInputSource(self, monitor_id, input_code):
@@ -3,12 +3,22 @@
 import sys
 import os
 import json
-import threading
+import hashlib
+import logging
+import re
+from datetime import datetime, timezone
+from pathlib import Path
+from types import MappingProxyType
 import time
+import shutil
 import subprocess
 
 # Set environment variables for Qt6 and GPU acceleration
-os.environ['QT_QPA_PLATFORM'] = 'xcb'
+# Prefer native Wayland when the session offers it (xcb as fallback);
+# setdefault keeps any user-provided platform choice intact
+os.environ.setdefault(
+    'QT_QPA_PLATFORM',
+    'wayland;xcb' if os.environ.get('WAYLAND_DISPLAY') else 'xcb')
 # Enable hardware acceleration - remove software rendering for GPU acceleration
 os.environ['QSG_RHI_BACKEND'] = 'opengl'  # Use OpenGL for GPU acceleration
 os.environ['QSG_RHI_DEBUG_LAYER'] = '0'  # Disable debug layer for performance
@@ -19,22 +29,400 @@ os.environ['QT_OPENGL_BUGLIST'] = '0'  # Disable OpenGL bug workarounds
 os.environ['QT_QUICK_CONTROLS_HOVER_ENABLED'] = '1'  # Enable hardware hover effects
 os.environ['QSG_RENDER_LOOP'] = 'threaded'  # Use threaded render loop for better performance
 
+def _acquire_instance_lock():
+    """Take the single-instance flock; None means another instance is live"""
+    import fcntl
+    lock_file = f"/tmp/monitor-remote-control-gui-{os.getuid()}.lock"
+    fd = os.open(lock_file, os.O_RDWR | os.O_CREAT, 0o600)
+    try:
+        fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except BlockingIOError:
+        os.close(fd)
+        return None
+    return fd
+
+
+_instance_lock_fd = None
+if __name__ == "__main__":
+    # Grab the lock before the heavy Qt imports below, so launching a
+    # duplicate exits in milliseconds instead of paying the full PyQt
+    # module import first
+    _instance_lock_fd = _acquire_instance_lock()
+    if _instance_lock_fd is None:
+        print("Another instance of Auto Brightness & Monitor Control is already running.")
+        sys.exit(1)
+
 # Import Qt6 instead of Qt5
 try:
     from PyQt6.QtWidgets import QApplication
-    from PyQt6.QtQml import QQmlApplicationEngine, qmlRegisterType
-    from PyQt6.QtCore import QObject, pyqtSignal, pyqtSlot, QTimer, pyqtProperty, QUrl
+    from PyQt6.QtQml import QQmlApplicationEngine, qmlRegisterType, QQmlComponent
+    from PyQt6.QtCore import (QObject, pyqtSignal, pyqtSlot, QTimer, pyqtProperty, QUrl,
+                              QUrlQuery, QThreadPool, QRunnable, QAbstractListModel,
+                              QModelIndex, Qt, QProcess)
     from PyQt6.QtGui import QIcon
+    from PyQt6.QtNetwork import QNetworkAccessManager, QNetworkRequest
     QT_VERSION = 6
 except ImportError:
     print("PyQt6 not available, falling back to PyQt5")
     from PyQt5.QtWidgets import QApplication
-    from PyQt5.QtQml import QQmlApplicationEngine, qmlRegisterType
-    from PyQt5.QtCore import QObject, pyqtSignal, pyqtSlot, QTimer, pyqtProperty, QUrl
+    from PyQt5.QtQml import QQmlApplicationEngine, qmlRegisterType, QQmlComponent
+    from PyQt5.QtCore import (QObject, pyqtSignal, pyqtSlot, QTimer, pyqtProperty, QUrl,
+                              QUrlQuery, QThreadPool, QRunnable, QAbstractListModel,
+                              QModelIndex, Qt, QProcess)
     from PyQt5.QtGui import QIcon
+    from PyQt5.QtNetwork import QNetworkAccessManager, QNetworkRequest
     QT_VERSION = 5
 
 from monitor_control import HybridMonitorControl
+from brightness_math import (solar_elevation, brightness_factor,
+                             CURVE_SCALED, CURVE_SIMPLE)
+
+# Qt spells these enums differently across the two bindings; resolve once
+# at import instead of per use
+_USER_ROLE = Qt.ItemDataRole.UserRole if QT_VERSION == 6 else Qt.UserRole
+_APP_ACTIVE = (Qt.ApplicationState.ApplicationActive if QT_VERSION == 6
+               else Qt.ApplicationActive)
+
+# pyudev gives us instant hotplug notification; without it we fall back
+# to the old polling refresh
+try:
+    import pyudev
+except ImportError:
+    pyudev = None
+
+# orjson encodes/decodes several times faster than stdlib json; both
+# helpers deal in bytes so the callers don't care which one is active
+try:
+    import orjson
+    _dumps = lambda obj: orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    _loads = orjson.loads
+except ImportError:
+    _dumps = lambda obj: json.dumps(obj, indent=2).encode()
+    _loads = json.loads
+
+# Detected monitors + capabilities persisted across launches, keyed by a
+# fingerprint of the connected EDIDs (see _edid_fingerprint)
+_MONITOR_CACHE_PATH = Path.home() / ".cache" / "auto-brightness" / "monitors.json"
+
+# Debug spew is off unless explicitly requested, e.g. AUTO_BRIGHTNESS_LOG=DEBUG.
+# %s-style arguments are only formatted when the level is actually enabled,
+# so logger.debug calls in hot paths cost a single level check.
+logger = logging.getLogger(__name__)
+logging.basicConfig(level=os.environ.get('AUTO_BRIGHTNESS_LOG', 'WARNING').upper())
+
+# Matches one feature per "getvcp" output line, e.g.
+# "VCP code 0x10 (Brightness): current value = 80, max value = 100"
+_GETVCP_RE = re.compile(r'VCP code 0x([0-9A-Fa-f]{2}).*?current value\s*=\s*(\d+)')
+
+# Complete coordinate values; partial keystrokes ("-", "12.") simply don't
+# match yet, so the setters never take a float() ValueError per keypress
+_LAT_RE = re.compile(r'^-?\d{1,2}(\.\d+)?$')
+_LON_RE = re.compile(r'^-?\d{1,3}(\.\d+)?$')
+
+
+class _Job(QRunnable):
+    """Wrap a plain callable for the shared Qt thread pool"""
+
+    def __init__(self, fn):
+        super().__init__()
+        self._fn = fn
+
+    def run(self):
+        self._fn()
+
+
+def _run_in_pool(fn):
+    """Run fn on the global QThreadPool instead of a fresh OS thread"""
+    QThreadPool.globalInstance().start(_Job(fn))
+
+# VCP feature definitions shared by every controller, built once at import
+# and frozen so callers cannot mutate the shared table.
+_VCP_DEFINITIONS = MappingProxyType({
+    # Display Control
+    '10': {'name': 'Brightness', 'type': 'slider', 'min': 0, 'max': 100, 'suffix': '%'},
+    '12': {'name': 'Contrast', 'type': 'slider', 'min': 0, 'max': 100, 'suffix': '%'},
+    '13': {'name': 'Backlight Control', 'type': 'slider', 'min': 0, 'max': 100, 'suffix': '%'},
+    '87': {'name': 'Sharpness', 'type': 'slider', 'min': 0, 'max': 100, 'suffix': '%'},
+    
+    # Color Control
+    '14': {'name': 'Color Preset', 'type': 'combo', 'values': {
+        '1': 'sRGB', '2': 'Adobe RGB', '3': 'Wide Gamut', '4': 'Native', 
+        '5': 'User 1', '6': 'User 2', '7': 'User 3', '8': '6500K', 
+        '9': '7500K', '10': '9300K', '11': 'Custom'
+    }},
+    '16': {'name': 'Red Gain', 'type': 'slider', 'min': 0, 'max': 100, 'suffix': '%'},
+    '18': {'name': 'Green Gain', 'type': 'slider', 'min': 0, 'max': 100, 'suffix': '%'},
+    '1A': {'name': 'Blue Gain', 'type': 'slider', 'min': 0, 'max': 100, 'suffix': '%'},
+    '6C': {'name': 'Red Black Level', 'type': 'stepper', 'min': 0, 'max': 100, 'suffix': ''},
+    '6E': {'name': 'Green Black Level', 'type': 'stepper', 'min': 0, 'max': 100, 'suffix': ''},
+    '70': {'name': 'Blue Black Level', 'type': 'stepper', 'min': 0, 'max': 100, 'suffix': ''},
+    '0B': {'name': 'Color Temperature Increment', 'type': 'stepper', 'min': 0, 'max': 20, 'suffix': ''},
+    '0C': {'name': 'Color Temperature Request', 'type': 'combo', 'values': {
+        '1': '3000K', '2': '4000K', '3': '5000K', '4': '6500K', '5': '7500K', '6': '9300K', '7': '10000K'
+    }},
+    '56': {'name': 'Hue', 'type': 'slider', 'min': 0, 'max': 100, 'suffix': '°'},
+    '58': {'name': 'Saturation', 'type': 'slider', 'min': 0, 'max': 100, 'suffix': '%'},
+    '59': {'name': 'Color Curve Adjust', 'type': 'stepper', 'min': 0, 'max': 10, 'suffix': ''},
+    '5A': {'name': 'Color LUT Size', 'type': 'readonly', 'min': 0, 'max': 65535, 'suffix': ' entries'},
+    '5B': {'name': 'Single Point LUT Operation', 'type': 'combo', 'values': {
+        '1': 'Upload Red', '2': 'Upload Green', '3': 'Upload Blue', '4': 'Upload All'
+    }},
+    '1F': {'name': 'Auto Setup', 'type': 'combo', 'values': {
+        '1': 'Auto Setup Off', '2': 'Auto Setup On'
+    }},
+    '8A': {'name': 'Color Saturation', 'type': 'slider', 'min': 0, 'max': 100, 'suffix': '%'},
+    
+    # Input Control
+    '60': {'name': 'Input Source', 'type': 'combo', 'values': {
+        '1': 'VGA 1', '2': 'VGA 2', '3': 'DVI 1', '4': 'DVI 2', 
+        '15': 'DisplayPort 1', '16': 'DisplayPort 2', '17': 'HDMI 1', 
+        '18': 'HDMI 2', '19': 'HDMI 3', '20': 'HDMI 4', '27': 'USB-C'
+    }},
+    '214': {'name': 'Power Mode', 'type': 'combo', 'values': {
+        '1': 'On', '2': 'Standby', '4': 'Suspend', '5': 'Off'
+    }},
+    
+    # Geometry Control
+    '20': {'name': 'Horizontal Position', 'type': 'stepper', 'min': 0, 'max': 100, 'suffix': ''},
+    '30': {'name': 'Vertical Position', 'type': 'stepper', 'min': 0, 'max': 100, 'suffix': ''},
+    '22': {'name': 'Horizontal Size', 'type': 'stepper', 'min': 0, 'max': 100, 'suffix': ''},
+    '32': {'name': 'Vertical Size', 'type': 'stepper', 'min': 0, 'max': 100, 'suffix': ''},
+    '40': {'name': 'Horizontal Pincushion', 'type': 'stepper', 'min': 0, 'max': 100, 'suffix': ''},
+    '42': {'name': 'Horizontal Pincushion Balance', 'type': 'stepper', 'min': 0, 'max': 100, 'suffix': ''},
+    '41': {'name': 'Vertical Pincushion', 'type': 'stepper', 'min': 0, 'max': 100, 'suffix': ''},
+    '43': {'name': 'Vertical Pincushion Balance', 'type': 'stepper', 'min': 0, 'max': 100, 'suffix': ''},
+    '44': {'name': 'Horizontal Convergence R/B', 'type': 'stepper', 'min': 0, 'max': 100, 'suffix': ''},
+    '45': {'name': 'Horizontal Convergence M/G', 'type': 'stepper', 'min': 0, 'max': 100, 'suffix': ''},
+    '46': {'name': 'Vertical Convergence R/B', 'type': 'stepper', 'min': 0, 'max': 100, 'suffix': ''},
+    '47': {'name': 'Vertical Convergence M/G', 'type': 'stepper', 'min': 0, 'max': 100, 'suffix': ''},
+    '48': {'name': 'Horizontal Linearity', 'type': 'stepper', 'min': 0, 'max': 100, 'suffix': ''},
+    '49': {'name': 'Horizontal Linearity Balance', 'type': 'stepper', 'min': 0, 'max': 100, 'suffix': ''},
+    '4A': {'name': 'Vertical Linearity', 'type': 'stepper', 'min': 0, 'max': 100, 'suffix': ''},
+    '4B': {'name': 'Vertical Linearity Balance', 'type': 'stepper', 'min': 0, 'max': 100, 'suffix': ''},
+    '4C': {'name': 'Horizontal Misconvergence', 'type': 'stepper', 'min': 0, 'max': 100, 'suffix': ''},
+    '4D': {'name': 'Vertical Misconvergence', 'type': 'stepper', 'min': 0, 'max': 100, 'suffix': ''},
+    '4E': {'name': 'Horizontal Focus', 'type': 'stepper', 'min': 0, 'max': 100, 'suffix': ''},
+    '4F': {'name': 'Vertical Focus', 'type': 'stepper', 'min': 0, 'max': 100, 'suffix': ''},
+    '24': {'name': 'Horizontal Frequency', 'type': 'readonly', 'min': 0, 'max': 65535, 'suffix': ' Hz'},
+    '33': {'name': 'Vertical Frequency', 'type': 'readonly', 'min': 0, 'max': 65535, 'suffix': ' Hz'},
+    
+    # Display Scaling & Overscan
+    '86': {'name': 'Display Scaling', 'type': 'combo', 'values': {
+        '1': 'No Scaling', '2': 'Max Image, No AR', '3': 'Max Image, AR', '4': 'Max Vertical Image', '5': 'Max Horizontal Image'
+    }},
+    '88': {'name': 'Horizontal Overscan', 'type': 'stepper', 'min': 0, 'max': 100, 'suffix': '%'},
+    '89': {'name': 'Vertical Overscan', 'type': 'stepper', 'min': 0, 'max': 100, 'suffix': '%'},
+    
+    # Audio Control
+    '8D': {'name': 'Audio Speaker Volume', 'type': 'slider', 'min': 0, 'max': 100, 'suffix': '%'},
+    '8F': {'name': 'Audio Microphone Volume', 'type': 'slider', 'min': 0, 'max': 100, 'suffix': '%'},
+    '62': {'name': 'Audio Mute', 'type': 'combo', 'values': {'1': 'Muted', '2': 'Unmuted'}},
+    '63': {'name': 'Audio Treble', 'type': 'slider', 'min': 0, 'max': 100, 'suffix': '%'},
+    '64': {'name': 'Audio Bass', 'type': 'slider', 'min': 0, 'max': 100, 'suffix': '%'},
+    '65': {'name': 'Audio Balance L/R', 'type': 'slider', 'min': 0, 'max': 100, 'suffix': '%'},
+    '66': {'name': 'Audio Processor Mode', 'type': 'combo', 'values': {
+        '1': 'Speaker', '2': 'Headphone', '3': 'External Audio'
+    }},
+    
+    # OSD Control
+    'CA': {'name': 'OSD Language', 'type': 'combo', 'values': {
+        '1': 'Chinese (Traditional)', '2': 'English', '3': 'French', '4': 'German', '5': 'Italian', 
+        '6': 'Japanese', '7': 'Korean', '8': 'Portuguese', '9': 'Russian', '10': 'Spanish',
+        '11': 'Swedish', '12': 'Turkish', '13': 'Chinese (Simplified)', '14': 'Portuguese (Brazil)',
+        '15': 'Arabic', '16': 'Bulgarian', '17': 'Croatian', '18': 'Czech', '19': 'Danish',
+        '20': 'Dutch', '21': 'Estonian', '22': 'Finnish', '23': 'Greek', '24': 'Hebrew',
+        '25': 'Hindi', '26': 'Hungarian', '27': 'Latvian', '28': 'Lithuanian', '29': 'Norwegian',
+        '30': 'Polish', '31': 'Romanian', '32': 'Serbian', '33': 'Slovak', '34': 'Slovenian',
+        '35': 'Thai', '36': 'Ukrainian'
+    }},
+    'CC': {'name': 'OSD Display Time', 'type': 'stepper', 'min': 1, 'max': 60, 'suffix': ' sec'},
+    '52': {'name': 'Active Control', 'type': 'combo', 'values': {
+        '1': 'Brightness/Contrast', '2': 'Color Temperature', '3': 'Color Preset',
+        '4': 'Audio Volume', '5': 'Audio Balance', '6': 'Red Gain', '7': 'Green Gain',
+        '8': 'Blue Gain', '9': 'Focus', '10': 'Auto Setup', '11': 'Factory Reset'
+    }},
+    '04': {'name': 'Factory Reset', 'type': 'combo', 'values': {
+        '1': 'Reset to Factory Defaults', '2': 'Reset Color', '3': 'Reset Geometry'
+    }},
+    '05': {'name': 'Factory Reset Enable', 'type': 'combo', 'values': {
+        '1': 'Cannot Reset', '2': 'Can Reset'
+    }},
+    '06': {'name': 'Power Mode', 'type': 'combo', 'values': {
+        '1': 'On', '2': 'Standby', '4': 'Suspend', '5': 'Off', '6': 'Hard Off'
+    }},
+    '08': {'name': 'Factory Color Defaults', 'type': 'combo', 'values': {
+        '1': 'Reset Color to Factory'
+    }},
+    '0A': {'name': 'Factory Geometry Defaults', 'type': 'combo', 'values': {
+        '1': 'Reset Geometry to Factory'
+    }},
+    
+    # Screen Saver and Power Management
+    'D6': {'name': 'DPMS Control', 'type': 'combo', 'values': {
+        '1': 'DPMS On', '2': 'DPMS Standby', '3': 'DPMS Suspend', '4': 'DPMS Off'
+    }},
+    'E0': {'name': 'Screen Saver Control', 'type': 'combo', 'values': {
+        '1': 'Screen Saver Off', '2': 'Screen Saver On'
+    }},
+    'E1': {'name': 'Screen Saver Delay', 'type': 'stepper', 'min': 1, 'max': 255, 'suffix': ' min'},
+    'E2': {'name': 'Power LED', 'type': 'combo', 'values': {
+        '1': 'Off', '2': 'On'
+    }},
+    
+    # Special Features
+    '54': {'name': 'Performance Preservation', 'type': 'combo', 'values': {
+        '1': 'No Guarantee', '2': 'Guarantee'
+    }},
+    '55': {'name': 'Auto Color Setup', 'type': 'combo', 'values': {
+        '1': 'Auto Color Setup Off', '2': 'Auto Color Setup On'
+    }},
+    '1E': {'name': 'Auto Setup Enable', 'type': 'combo', 'values': {
+        '1': 'Auto Setup Disabled', '2': 'Auto Setup Enabled'
+    }},
+    
+    # Information (Read-Only)
+    'DF': {'name': 'VCP Version', 'type': 'readonly', 'min': 0, 'max': 255, 'suffix': ''},
+    'C0': {'name': 'Display Usage Time', 'type': 'readonly', 'min': 0, 'max': 65535, 'suffix': ' hours'},
+    'C6': {'name': 'Application Enable Key', 'type': 'readonly', 'min': 0, 'max': 65535, 'suffix': ''},
+    'C8': {'name': 'Display Controller Type', 'type': 'readonly', 'min': 0, 'max': 65535, 'suffix': ''},
+    'C9': {'name': 'Display Firmware Level', 'type': 'readonly', 'min': 0, 'max': 65535, 'suffix': ''},
+    'DC': {'name': 'Display Application', 'type': 'readonly', 'min': 0, 'max': 255, 'suffix': ''},
+    'DD': {'name': 'Capabilities Request', 'type': 'readonly', 'min': 0, 'max': 255, 'suffix': ''},
+    'DE': {'name': 'Capabilities Reply', 'type': 'readonly', 'min': 0, 'max': 255, 'suffix': ''},
+    'F0': {'name': 'OSD', 'type': 'combo', 'values': {
+        '1': 'OSD Disabled', '2': 'OSD Enabled'
+    }},
+    'F1': {'name': 'OSD Language', 'type': 'combo', 'values': {
+        '1': 'Chinese', '2': 'English', '3': 'French', '4': 'German', '5': 'Italian'
+    }},
+    'F2': {'name': 'Status Indicators', 'type': 'combo', 'values': {
+        '1': 'Status Indicators Off', '2': 'Status Indicators On'
+    }},
+    'F3': {'name': 'Auxiliary Power Output', 'type': 'combo', 'values': {
+        '1': 'Auxiliary Off', '2': 'Auxiliary On'
+    }},
+    'F4': {'name': 'Auxiliary Display Data', 'type': 'stepper', 'min': 0, 'max': 255, 'suffix': ''},
+    'F5': {'name': 'Auxiliary Display', 'type': 'combo', 'values': {
+        '1': 'Auxiliary Display Off', '2': 'Auxiliary Display On'
+    }}
+})
+
+def _intern_definition_strings(definitions):
+    """Collapse the duplicated literals in the definitions table (types,
+    suffixes, value labels) onto single interned str objects - less heap
+    and pointer-fast equality for the comparisons QML triggers"""
+    for entry in definitions.values():
+        entry['type'] = sys.intern(entry['type'])
+        if 'suffix' in entry:
+            entry['suffix'] = sys.intern(entry['suffix'])
+        values = entry.get('values')
+        if values:
+            for key in values:
+                values[key] = sys.intern(values[key])
+
+
+# The proxy is read-only but the per-code dicts inside are ours to fix up
+_intern_definition_strings(_VCP_DEFINITIONS)
+
+# Hex code -> int, interned once so hot paths never re-parse the strings
+# QML hands us ("10" -> 0x10 etc.)
+_VCP_CODE_INT = {code: int(code, 16) for code in _VCP_DEFINITIONS}
+
+# Compact membership set for "is this a code we know" checks; keeps the
+# value-rich definitions dict out of the lookup entirely
+_VCP_CODES = frozenset(_VCP_DEFINITIONS)
+
+
+def _vcp_code_int(code):
+    """Int value of a VCP hex code; known codes skip the re-parse"""
+    value = _VCP_CODE_INT.get(code)
+    if value is None:
+        try:
+            value = int(code, 16)
+        except (TypeError, ValueError):
+            value = -1
+    return value
+
+# Shared template for unknown VCP codes; getFeatureInfo copies it and
+# fills in the per-call fields instead of rebuilding the literal each time
+_FALLBACK_FEATURE_TEMPLATE = {'type': 'textfield', 'min': 0, 'max': 255, 'suffix': ''}
+
+# Fully-populated feature-info dicts, defaults applied once at import so
+# getFeatureInfo answers known codes with a plain lookup instead of a
+# per-call dict build with .get() chains
+_VCP_FEATURE_INFO = MappingProxyType({
+    code: {
+        'name': definition['name'],
+        'type': definition['type'],
+        'code': code,
+        'values': definition.get('values', {}),
+        'min': definition.get('min', 0),
+        'max': definition.get('max', 255),
+        'suffix': definition.get('suffix', ''),
+    }
+    for code, definition in _VCP_DEFINITIONS.items()
+})
+
+# The same entries in a flat list indexed by int code: an array index
+# instead of a string hash on the getFeatureInfo hot path
+_VCP_FEATURE_TABLE = [None] * 0x220
+for _code, _info in _VCP_FEATURE_INFO.items():
+    _VCP_FEATURE_TABLE[_VCP_CODE_INT[_code]] = _info
+del _code, _info
+
+
+
+class MonitorListModel(QAbstractListModel):
+    """List model over the detected monitors.
+
+    QML delegates pull individual roles lazily through data(), so a
+    monitorsChanged no longer marshals the whole list of monitor dicts
+    into QVariantMaps on every property read.
+    """
+
+    IdRole = _USER_ROLE + 1
+    NameRole = _USER_ROLE + 2
+    BusRole = _USER_ROLE + 3
+    CapsRole = _USER_ROLE + 4
+    FeaturesRole = _USER_ROLE + 5
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows = []
+
+    def rowCount(self, parent=QModelIndex()):
+        return len(self._rows)
+
+    def data(self, index, role):
+        if not index.isValid() or not (0 <= index.row() < len(self._rows)):
+            return None
+        monitor = self._rows[index.row()]
+        if role == self.IdRole:
+            return monitor.get('id', '')
+        if role == self.NameRole:
+            return monitor.get('name', '')
+        if role == self.BusRole:
+            return monitor.get('bus') or ''
+        if role == self.CapsRole:
+            return monitor.get('capabilities', [])
+        if role == self.FeaturesRole:
+            return monitor.get('features', {})
+        return None
+
+    def roleNames(self):
+        return {
+            self.IdRole: b'monitorId',
+            self.NameRole: b'name',
+            self.BusRole: b'bus',
+            self.CapsRole: b'capabilities',
+            self.FeaturesRole: b'features',
+        }
+
+    def reset_rows(self, rows):
+        self.beginResetModel()
+        self._rows = rows
+        self.endResetModel()
+
 
 class BrightnessController(QObject):
     """Backend controller for brightness and monitor management"""
@@ -43,6 +431,12 @@ class BrightnessController(QObject):
     configChanged = pyqtSignal()
     statusChanged = pyqtSignal(str, str)  # message, type
     monitorsChanged = pyqtSignal()
+    # Emitted from the udev observer thread; the queued connection hops
+    # the refresh back onto the Qt main thread
+    _hotplugDetected = pyqtSignal()
+    # Probed (monitor_id, features) from a pool worker; same hop - the
+    # model reset must happen on the GUI thread
+    _capsDetected = pyqtSignal(str, 'QVariant')
     
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -53,36 +447,117 @@ class BrightnessController(QObject):
         else:
             self.config_path = "/etc/monitor-remote-control/config.json"
         self._config = self.load_config()
+        self._config_serialized = None  # last serialization written to disk
         self.monitor_control = HybridMonitorControl()
         self._monitors = {}
         self._current_monitor = None
+        # Derived views QML re-reads on every monitorsChanged; rebuilt once
+        # per mutation in _rebuild_derived instead of per property access
+        self._monitors_list = []
+        self._current_caps = []
+        self._current_features = {}
+        self._monitors_model = MonitorListModel(self)
+        self._nam = QNetworkAccessManager(self)
+        # Probe for ddcutil once; on DDC-less systems (laptop panels,
+        # embedded HDMI) every slot can then bail out before paying for a
+        # doomed detect/probe round trip
+        self._ddcutil_available = shutil.which('ddcutil') is not None
+        self._has_ddc = False
+        # getFeatureInfo results that needed a per-monitor merge, keyed by
+        # (monitor, code); cleared in _rebuild_derived when monitors change
+        self._feature_info_cache = {}
+        self._capsDetected.connect(self._apply_detected_caps)
         
-        # Auto-refresh monitors (less frequent for better performance)
+        # Refresh on actual hotplug events when pyudev is available, with a
+        # slow timer as a safety net; otherwise poll at the old 2-minute rate
+        self._udev_observer = self._start_udev_observer()
         self.refresh_timer = QTimer()
         self.refresh_timer.timeout.connect(self.refresh_monitors)
-        self.refresh_timer.start(120000)  # Refresh every 2 minutes instead of 30 seconds
+        self._refresh_interval = 1800000 if self._udev_observer else 120000
+        self.refresh_timer.start(self._refresh_interval)
+        # When the poll was last paused; lets the resume path tell a quick
+        # alt-tab from a genuinely missed refresh deadline
+        self._paused_at = time.monotonic()
+
+        # Stop the polling timer while the app is in the background so a
+        # hidden window doesn't keep waking the process
+        app = QApplication.instance()
+        if app is not None:
+            app.applicationStateChanged.connect(self._on_app_state_changed)
         
-        # Cache for VCP definitions to avoid recreating them
-        self._vcp_definitions_cache = None
-        
-        # Cache for monitor values to reduce ddcutil calls
+        # Cache for monitor values to reduce ddcutil calls. Entries are
+        # (value, monotonic expiry) tuples so each feature ages out on its
+        # own TTL instead of every slider going cold at once on a timer.
         self._value_cache = {}
-        self._cache_timer = QTimer()
-        self._cache_timer.timeout.connect(self._clear_value_cache)
-        self._cache_timer.start(5000)  # Clear cache every 5 seconds
+
+        # Last solar-elevation computation, keyed by (time bucket, lat, lon)
+        self._solar_cache = None
 
         # Debounce timer for service restart (prevents rapid restarts during slider drag)
         self._restart_timer = QTimer()
         self._restart_timer.setSingleShot(True)
         self._restart_timer.timeout.connect(self._do_restart_service)
 
+        # Coalesce slider-drag VCP writes: keep only the latest value per
+        # (monitor, feature) and commit once the drag pauses for 80ms
+        self._pending_writes = {}
+        self._write_timer = QTimer()
+        self._write_timer.setSingleShot(True)
+        self._write_timer.timeout.connect(self._flush_pending_writes)
+
+        # Coalesce config saves from slider drags into one disk write
+        self._pending_restart = False
+        self._save_timer = QTimer()
+        self._save_timer.setSingleShot(True)
+        self._save_timer.timeout.connect(self._flush_config)
+
+        # Same debounce for the all-monitor preview slider: remember only
+        # the newest value and write once per pause in the drag
+        self._pending_preview = None
+        self._last_preview = None
+        self._preview_timer = QTimer()
+        self._preview_timer.setSingleShot(True)
+        self._preview_timer.timeout.connect(self._do_preview)
+
         # Initial monitor detection
         self.refresh_monitors()
     
+    def _on_app_state_changed(self, state):
+        """Pause the refresh poll while inactive, resume when the app
+        comes back to the foreground"""
+        if state == _APP_ACTIVE:
+            if not self.refresh_timer.isActive():
+                self.refresh_timer.start(self._refresh_interval)
+                # Qt flips Active on every focus change, and a forced
+                # refresh is a multi-second bus scan on the GUI thread -
+                # only catch up if a poll actually came due while paused
+                if (time.monotonic() - self._paused_at
+                        >= self._refresh_interval / 1000):
+                    self.refresh_monitors()
+        else:
+            self._paused_at = time.monotonic()
+            self.refresh_timer.stop()
+
+    def _start_udev_observer(self):
+        """Subscribe to drm add/remove events so hotplugs refresh instantly"""
+        if pyudev is None:
+            return None
+        try:
+            context = pyudev.Context()
+            monitor = pyudev.Monitor.from_netlink(context)
+            monitor.filter_by('drm')
+            self._hotplugDetected.connect(self.refresh_monitors)
+            observer = pyudev.MonitorObserver(
+                monitor, callback=lambda device: self._hotplugDetected.emit())
+            observer.start()
+            return observer
+        except Exception:
+            return None
+
     def load_config(self):
         try:
-            with open(self.config_path, 'r') as f:
-                return json.load(f)
+            with open(self.config_path, 'rb') as f:
+                return _loads(f.read())
         except FileNotFoundError:
             return {
                 "min_brightness": 0.3, 
@@ -93,25 +568,56 @@ class BrightnessController(QObject):
             }
     
     def save_config(self, restart_service=False):
+        """Schedule a config write; rapid setter calls coalesce into one"""
+        self._pending_restart = self._pending_restart or restart_service
+        self._save_timer.start(200)
+
+    def _flush_config(self):
+        restart_service, self._pending_restart = self._pending_restart, False
         try:
-            with open(self.config_path, 'w') as f:
-                json.dump(self._config, f, indent=2)
+            serialized = _dumps(self._config)
+            if serialized == self._config_serialized:
+                # Nothing changed - skip the write, the configChanged
+                # rebinding cascade and the service restart entirely
+                return
+            # Write-then-rename so a crash mid-write can't corrupt the config
+            tmp_path = self.config_path + '.tmp'
+            with open(tmp_path, 'wb') as f:
+                f.write(serialized)
+            os.replace(tmp_path, self.config_path)
+            self._config_serialized = serialized
             self.configChanged.emit()
             if restart_service:
-                self.restart_service()
+                # Debounced so a slider drag coalesces into one restart
+                self._restart_timer.start(400)
         except Exception as e:
             self.statusChanged.emit(f"Error saving config: {e}", "error")
 
     def restart_service(self):
         """Restart the auto-brightness service to apply changes immediately"""
-        try:
-            subprocess.run(['systemctl', '--user', 'restart', 'auto-brightness.service'],
-                         check=True, capture_output=True)
-            self.statusChanged.emit("Service restarted", "success")
-        except subprocess.CalledProcessError as e:
-            self.statusChanged.emit(f"Failed to restart service: {e}", "error")
-        except Exception as e:
-            self.statusChanged.emit(f"Error restarting service: {e}", "error")
+        self._start_restart_process("Service restarted", "Failed to restart service")
+
+    def _set_cfg(self, key, value, restart=False):
+        """Write one config key and persist; shared body of the setters"""
+        if self._config.get(key) == value:
+            return
+        self._config[key] = value
+        self.save_config(restart_service=restart)
+
+    def _start_restart_process(self, success_msg, error_msg):
+        """Restart the service via QProcess - event-loop integrated, no
+        worker thread or pipe buffering, status reported on completion"""
+        proc = QProcess(self)
+
+        def on_finished(exit_code, exit_status):
+            if exit_code == 0:
+                self.statusChanged.emit(success_msg, "success")
+            else:
+                self.statusChanged.emit(error_msg, "error")
+            proc.deleteLater()
+
+        proc.finished.connect(on_finished)
+        proc.start('systemctl', ['--user', 'restart', 'auto-brightness.service'])
     
     # Properties for QML binding
     @pyqtProperty(float, notify=configChanged)
@@ -120,9 +626,7 @@ class BrightnessController(QObject):
     
     @minBrightness.setter
     def minBrightness(self, value):
-        self._config["min_brightness"] = value / 100
-        self.save_config(restart_service=True)
-        self.configChanged.emit()
+        self._set_cfg("min_brightness", value / 100, restart=True)
     
     @pyqtProperty(float, notify=configChanged)
     def maxBrightness(self):
@@ -130,9 +634,7 @@ class BrightnessController(QObject):
     
     @maxBrightness.setter
     def maxBrightness(self, value):
-        self._config["max_brightness"] = value / 100
-        self.save_config(restart_service=True)
-        self.configChanged.emit()
+        self._set_cfg("max_brightness", value / 100, restart=True)
     
     @pyqtProperty(bool, notify=configChanged)
     def autoBrightnessEnabled(self):
@@ -140,9 +642,7 @@ class BrightnessController(QObject):
     
     @autoBrightnessEnabled.setter
     def autoBrightnessEnabled(self, value):
-        self._config["auto_brightness_enabled"] = value
-        self.save_config(restart_service=True)
-        self.configChanged.emit()
+        self._set_cfg("auto_brightness_enabled", value, restart=True)
 
     @pyqtProperty(bool, notify=configChanged)
     def useElevationScaling(self):
@@ -150,9 +650,7 @@ class BrightnessController(QObject):
 
     @useElevationScaling.setter
     def useElevationScaling(self, value):
-        self._config["use_elevation_scaling"] = value
-        self.save_config(restart_service=True)
-        self.configChanged.emit()
+        self._set_cfg("use_elevation_scaling", value, restart=True)
 
     @pyqtProperty(bool, notify=configChanged)
     def fullscreenBrightnessEnabled(self):
@@ -160,9 +658,7 @@ class BrightnessController(QObject):
 
     @fullscreenBrightnessEnabled.setter
     def fullscreenBrightnessEnabled(self, value):
-        self._config["fullscreen_brightness_enabled"] = value
-        self.save_config(restart_service=True)
-        self.configChanged.emit()
+        self._set_cfg("fullscreen_brightness_enabled", value, restart=True)
 
     @pyqtProperty(float, notify=configChanged)
     def fullscreenBrightness(self):
@@ -170,9 +666,7 @@ class BrightnessController(QObject):
 
     @fullscreenBrightness.setter
     def fullscreenBrightness(self, value):
-        self._config["fullscreen_brightness"] = value / 100
-        self.save_config(restart_service=True)
-        self.configChanged.emit()
+        self._set_cfg("fullscreen_brightness", value / 100, restart=True)
 
     @pyqtProperty(bool, notify=configChanged)
     def locationOverride(self):
@@ -185,20 +679,23 @@ class BrightnessController(QObject):
     
     @latitude.setter
     def latitude(self, value):
-        try:
-            # Only validate if user enters something
-            if value and value.strip():
-                lat = float(value.strip())
-                if not (-90 <= lat <= 90):
-                    self.statusChanged.emit("Latitude must be between -90 and 90", "error")
-                    return
-                self._config["latitude"] = lat
-            else:
-                self._config["latitude"] = None
+        text = value.strip() if value else ""
+        if not text:
+            self._config["latitude"] = None
             self.save_config()
-        except ValueError:
-            if value and value.strip():  # Only show error if user actually entered something
-                self.statusChanged.emit("Invalid latitude format", "error")
+            return
+        if not _LAT_RE.match(text):
+            # Incomplete or malformed - wait for more input rather than
+            # raising/catching a ValueError on every keystroke
+            return
+        lat = float(text)
+        if not (-90 <= lat <= 90):
+            self.statusChanged.emit("Latitude must be between -90 and 90", "error")
+            return
+        if lat == self._config.get("latitude"):
+            return
+        self._config["latitude"] = lat
+        self.save_config()
     
     @pyqtProperty(str, notify=configChanged)
     def longitude(self):
@@ -207,24 +704,52 @@ class BrightnessController(QObject):
     
     @longitude.setter
     def longitude(self, value):
-        try:
-            # Only validate if user enters something
-            if value and value.strip():
-                lon = float(value.strip())
-                if not (-180 <= lon <= 180):
-                    self.statusChanged.emit("Longitude must be between -180 and 180", "error")
-                    return
-                self._config["longitude"] = lon
-            else:
-                self._config["longitude"] = None
+        text = value.strip() if value else ""
+        if not text:
+            self._config["longitude"] = None
             self.save_config()
-        except ValueError:
-            if value and value.strip():  # Only show error if user actually entered something
-                self.statusChanged.emit("Invalid longitude format", "error")
+            return
+        if not _LON_RE.match(text):
+            # Incomplete or malformed - wait for more input rather than
+            # raising/catching a ValueError on every keystroke
+            return
+        lon = float(text)
+        if not (-180 <= lon <= 180):
+            self.statusChanged.emit("Longitude must be between -180 and 180", "error")
+            return
+        if lon == self._config.get("longitude"):
+            return
+        self._config["longitude"] = lon
+        self.save_config()
     
+    def _rebuild_derived(self):
+        """Recompute the monitor views handed to QML after _monitors or
+        _current_monitor changes"""
+        self._monitors_list = list(self._monitors.values())
+        current = self._monitors.get(self._current_monitor)
+        self._current_caps = current.get('capabilities', []) if current else []
+        self._current_features = current.get('features', {}) if current else {}
+        self._monitors_model.reset_rows(self._monitors_list)
+        # Merged feature-info results are only valid for this generation
+        # of the monitor data
+        self._feature_info_cache = {}
+        # True when at least one monitor can actually be driven: non-DDC
+        # backends work without ddcutil, DDC ones need the binary
+        self._has_ddc = bool(self._monitors) and (
+            self._ddcutil_available
+            or any(info.get('backend', 'ddc') != 'ddc'
+                   for info in self._monitors.values()))
+
+    @pyqtProperty(QObject, constant=True)
+    def monitorsModel(self):
+        """Role-based model; preferred over the bulk monitors list"""
+        return self._monitors_model
+
     @pyqtProperty('QVariant', notify=monitorsChanged)
     def monitors(self):
-        return list(self._monitors.values())
+        # Legacy bulk list kept for existing QML; new views should bind
+        # monitorsModel instead
+        return self._monitors_list
     
     @pyqtProperty(str, notify=monitorsChanged)
     def currentMonitor(self):
@@ -232,23 +757,50 @@ class BrightnessController(QObject):
     
     @currentMonitor.setter
     def currentMonitor(self, monitor_id):
-        print(f"DEBUG: Setting current monitor to: {monitor_id}")
+        logger.debug("Setting current monitor to: %s", monitor_id)
         self._current_monitor = monitor_id
+        self._rebuild_derived()
         self.detectMonitorCapabilities()
+        self._prefetch_monitor_values(monitor_id)
         self.monitorsChanged.emit()
+
+    def _prefetch_monitor_values(self, monitor_id):
+        """Warm the value cache with one bulk getvcp call for all known features.
+
+        One ddcutil invocation with --skip-ddc-checks reads every supported
+        feature in a single DDC session, instead of paying per-feature
+        process spawn and DDC init checks as each widget polls its value.
+        """
+        monitor = self._monitors.get(monitor_id)
+        if not monitor or not monitor.get('bus'):
+            return
+
+        codes = [c for c in monitor.get('capabilities', [])
+                 if c in _VCP_CODES]
+        if not codes:
+            return
+
+        def prefetch_thread():
+            try:
+                result = subprocess.run(
+                    ['ddcutil', '--bus', monitor['bus'], '--skip-ddc-checks',
+                     '--sleep-multiplier', '.1', 'getvcp'] + codes,
+                    capture_output=True, text=True, timeout=30
+                )
+                for match in _GETVCP_RE.finditer(result.stdout):
+                    self._cache_value(monitor_id, match.group(1).upper(), int(match.group(2)))
+            except Exception as e:
+                logger.error("Error prefetching monitor values: %s", e)
+
+        _run_in_pool(prefetch_thread)
     
     @pyqtProperty('QVariant', notify=monitorsChanged)
     def currentMonitorCapabilities(self):
-        if self._current_monitor and self._current_monitor in self._monitors:
-            caps = self._monitors[self._current_monitor].get('capabilities', [])
-            return caps
-        return []
-    
+        return self._current_caps
+
     @pyqtProperty('QVariant', notify=monitorsChanged)
     def currentMonitorFeatures(self):
-        if self._current_monitor and self._current_monitor in self._monitors:
-            return self._monitors[self._current_monitor].get('features', {})
-        return {}
+        return self._current_features
 
     @pyqtProperty('QVariant', notify=configChanged)
     def monitorOffsets(self):
@@ -289,208 +841,164 @@ class BrightnessController(QObject):
     @pyqtSlot()
     def refreshMonitorList(self):
         """Refresh the list of detected monitors for calibration"""
-        self.detectMonitors()
-        self.monitorsChanged.emit()
+        self.refresh_monitors()
 
     @pyqtSlot(str)
     def lookupCity(self, city_name):
         """Look up coordinates for a city name"""
         if not city_name or not city_name.strip():
             return
-            
+
         self.statusChanged.emit(f"Looking up coordinates for {city_name}...", "info")
-        
-        def lookup_thread():
-            try:
-                import requests
-                # Use a free geocoding service
-                url = f"https://geocoding-api.open-meteo.com/v1/search?name={city_name.strip()}&count=1&language=en&format=json"
-                response = requests.get(url, timeout=10)
-                data = response.json()
-                
-                if data.get('results') and len(data['results']) > 0:
-                    result = data['results'][0]
-                    lat = result['latitude']
-                    lon = result['longitude']
-                    city = result['name']
-                    country = result.get('country', '')
-                    
-                    # Update config on main thread
-                    self._config["latitude"] = lat
-                    self._config["longitude"] = lon
-                    self.save_config()
-                    
-                    self.statusChanged.emit(f"Found {city}, {country}: {lat:.4f}, {lon:.4f}", "success")
-                else:
-                    self.statusChanged.emit(f"City '{city_name}' not found", "error")
-                    
-            except Exception as e:
-                self.statusChanged.emit(f"Error looking up city: {e}", "error")
-        
-        threading.Thread(target=lookup_thread, daemon=True).start()
+
+        # Use a free geocoding service via Qt's async network stack - no
+        # worker thread, and the reply callback lands on the main thread
+        url = QUrl("https://geocoding-api.open-meteo.com/v1/search")
+        query = QUrlQuery()
+        query.addQueryItem("name", city_name.strip())
+        query.addQueryItem("count", "1")
+        query.addQueryItem("language", "en")
+        query.addQueryItem("format", "json")
+        url.setQuery(query)
+
+        reply = self._nam.get(QNetworkRequest(url))
+        reply.finished.connect(lambda: self._on_city_lookup_finished(reply, city_name))
+
+    def _on_city_lookup_finished(self, reply, city_name):
+        """Handle the geocoding reply and store the coordinates"""
+        try:
+            data = _loads(bytes(reply.readAll().data()))
+
+            if data.get('results') and len(data['results']) > 0:
+                result = data['results'][0]
+                lat = result['latitude']
+                lon = result['longitude']
+                city = result['name']
+                country = result.get('country', '')
+
+                self._config["latitude"] = lat
+                self._config["longitude"] = lon
+                self.save_config()
+
+                self.statusChanged.emit(f"Found {city}, {country}: {lat:.4f}, {lon:.4f}", "success")
+            else:
+                self.statusChanged.emit(f"City '{city_name}' not found", "error")
+
+        except Exception as e:
+            self.statusChanged.emit(f"Error looking up city: {e}", "error")
+        finally:
+            reply.deleteLater()
     
-    def _clear_value_cache(self):
-        """Clear the VCP value cache periodically"""
-        self._value_cache.clear()
+    def _value_ttl(self, vcp_code):
+        """Cache lifetime for a feature - readonly values change rarely"""
+        definition = _VCP_DEFINITIONS.get(vcp_code, {})
+        return 60.0 if definition.get('type') == 'readonly' else 5.0
+
+    def _cache_value(self, monitor_id, vcp_code, value):
+        """Store a VCP value with its per-feature expiry"""
+        # Tuple keys with the interned int code hash cheaper than a
+        # freshly concatenated string per lookup
+        cache_key = (monitor_id, _vcp_code_int(vcp_code))
+        now = time.monotonic()
+        self._value_cache[cache_key] = (value, now + self._value_ttl(vcp_code))
+        # Prune lazily once the cache outgrows the realistic working set
+        # (a few monitors x ~80 features) so stale monitors age out
+        if len(self._value_cache) > 512:
+            self._value_cache = {k: v for k, v in self._value_cache.items()
+                                 if v[1] > now}
 
     def _do_restart_service(self):
         """Actually restart the service (called after debounce delay)"""
         self.statusChanged.emit("Applying brightness settings...", "info")
-
-        def restart_thread():
-            try:
-                import subprocess
-                subprocess.run(['systemctl', '--user', 'restart', 'auto-brightness.service'],
-                             check=True, capture_output=True)
-                self.statusChanged.emit("Brightness updated!", "success")
-            except subprocess.CalledProcessError as e:
-                self.statusChanged.emit("Error applying settings", "error")
-
-        threading.Thread(target=restart_thread, daemon=True).start()
+        self._start_restart_process("Brightness updated!", "Error applying settings")
 
     @pyqtSlot(int)
     def previewBrightness(self, brightness_percent):
-        """Preview brightness on all monitors in real-time (doesn't save to config)"""
-        def preview_thread():
-            try:
-                monitors = self.monitor_control.detect_monitors()
-                for monitor_id in monitors.keys():
-                    self.monitor_control.set_vcp_value(monitor_id, "10", brightness_percent)
-            except Exception as e:
-                print(f"Preview brightness error: {e}")
+        """Preview brightness on all monitors in real-time (doesn't save to config)
+
+        Debounced: only the latest value of a drag gesture is written, and
+        values snap to 5% steps - the eye can't resolve finer and monitor
+        NVRAM has limited write cycles.
+        """
+        self._pending_preview = round(brightness_percent / 5) * 5
+        self._preview_timer.start(80)
 
-        threading.Thread(target=preview_thread, daemon=True).start()
+    def _do_preview(self):
+        """Write the final preview value of a gesture to every monitor"""
+        brightness_percent = self._pending_preview
+        if brightness_percent is None or not self._has_ddc:
+            return
+        self._pending_preview = None
+        if brightness_percent == self._last_preview:
+            return
+        self._last_preview = brightness_percent
+        # Reuse the monitor list detected by refresh_monitors - a fresh
+        # detect_monitors() costs seconds per slider tick - and write the
+        # monitors in parallel so N displays take ~one DDC round trip
+        for monitor_id in list(self._monitors):
+            def write_one(mid=monitor_id):
+                try:
+                    self.monitor_control.set_vcp_value(mid, "10", brightness_percent)
+                except Exception as e:
+                    logger.error("Preview brightness error: %s", e)
+            _run_in_pool(write_one)
+
+    def _solar_state(self):
+        """Current solar elevation, memoized in 30-second buckets.
+
+        getSolarElevation, isDaytime, getBrightnessPhase and
+        calculateCurrentBrightness are all QML-invokable and fire on every
+        rebind; the elevation moves well under a tenth of a degree in 30s,
+        so repeat calls within a bucket are a tuple compare. Returns None
+        when no location is configured.
+        """
+        lat = self._config.get("latitude")
+        lon = self._config.get("longitude")
+        if not lat or not lon:
+            return None
+        key = (int(time.time() // 30), lat, lon)
+        cached = self._solar_cache
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        dt = datetime.now(timezone.utc)
+        elevation = solar_elevation(dt.year, dt.month, dt.day,
+                                    dt.hour, dt.minute, dt.second, lat, lon)
+        self._solar_cache = (key, elevation)
+        return elevation
 
     @pyqtSlot(float, result=int)
     def calculateCurrentBrightness(self, max_brightness_percent):
         """Calculate what brightness would be right now based on solar elevation"""
         try:
-            lat = self._config.get("latitude")
-            lon = self._config.get("longitude")
             min_b = self._config.get("min_brightness", 0.3)
             max_b = max_brightness_percent / 100.0
 
-            if not lat or not lon:
+            elevation = self._solar_state()
+            if elevation is None:
                 return int(max_b * 100)
 
-            # Calculate solar elevation
-            from datetime import datetime, timezone
-            import math
-
-            dt = datetime.now(timezone.utc)
-
-            # Julian day calculation
-            a = (14 - dt.month) // 12
-            y = dt.year - a
-            m = dt.month + 12 * a - 3
-            jdn = dt.day + (153 * m + 2) // 5 + 365 * y + y // 4 - y // 100 + y // 400 - 32045
-
-            hour_decimal = dt.hour + dt.minute / 60.0 + dt.second / 3600.0
-            jd = jdn + (hour_decimal - 12) / 24.0
-            n = jd - 2451545.0
-
-            L = (280.460 + 0.9856474 * n) % 360
-            g = math.radians((357.528 + 0.9856003 * n) % 360)
-            lambda_sun = math.radians(L + 1.915 * math.sin(g) + 0.020 * math.sin(2 * g))
-            declination = math.asin(0.39795 * math.cos(lambda_sun))
-
-            # Simplified equation of time
-            eot = 4 * lon + 229.18 * (0.000075 + 0.001868 * math.cos(math.radians(n)) -
-                       0.032077 * math.sin(math.radians(n)) -
-                       0.014615 * math.cos(2 * math.radians(n)) -
-                       0.040849 * math.sin(2 * math.radians(n)))
-
-            tst = hour_decimal * 60 + eot
-            hour_angle = math.radians(15 * (tst / 60 - 12))
-
-            lat_rad = math.radians(lat)
-            elevation = math.degrees(math.asin(math.sin(declination) * math.sin(lat_rad) +
-                                     math.cos(declination) * math.cos(lat_rad) * math.cos(hour_angle)))
-
-            # Check if elevation scaling is enabled
+            # Both mappings are piecewise linear in elevation, so one
+            # table lookup per mode replaces the old if/elif ladder:
+            # scaled tracks sun height (low winter sun dims the range),
+            # simple is a plain twilight ramp
             use_scaling = self._config.get("use_elevation_scaling", True)
-
-            if not use_scaling:
-                # Simple day/night with twilight transition (-6° to 6°)
-                if elevation <= -6:
-                    brightness = min_b
-                elif elevation <= 6:
-                    # Smooth transition during twilight
-                    factor = (elevation + 6) / 12.0  # 0 at -6°, 1 at 6°
-                    brightness = min_b + (factor * (max_b - min_b))
-                else:
-                    brightness = max_b
-            else:
-                # Calculate brightness based on elevation (accounts for sun height)
-                # Low winter sun = less brightness, high summer sun = full brightness
-                if elevation <= -6:
-                    # Deep night
-                    brightness = min_b
-                elif elevation <= 0:
-                    # Twilight - gradual transition (0% to 30% of range)
-                    twilight_factor = (elevation + 6) / 6.0
-                    brightness = min_b + (0.3 * (max_b - min_b) * twilight_factor)
-                elif elevation <= 15:
-                    # Low sun (sunrise/sunset, winter midday) - 30% to 70%
-                    factor = 0.3 + 0.4 * (elevation / 15.0)
-                    brightness = min_b + (factor * (max_b - min_b))
-                elif elevation <= 40:
-                    # Good daylight - 70% to 100%
-                    factor = 0.7 + 0.3 * ((elevation - 15) / 25.0)
-                    brightness = min_b + (factor * (max_b - min_b))
-                else:
-                    # Bright midday sun - full brightness
-                    brightness = max_b
+            curve = CURVE_SCALED if use_scaling else CURVE_SIMPLE
+            factor = brightness_factor(elevation, curve)
+            brightness = min_b + factor * (max_b - min_b)
 
             return int(brightness * 100)
         except Exception as e:
-            print(f"Calculate brightness error: {e}")
+            logger.error("Calculate brightness error: %s", e)
             return int(max_brightness_percent)
 
     @pyqtSlot(result=float)
     def getSolarElevation(self):
         """Get current solar elevation in degrees"""
         try:
-            lat = self._config.get("latitude")
-            lon = self._config.get("longitude")
-
-            if not lat or not lon:
-                return 0.0
-
-            from datetime import datetime, timezone
-            import math
-
-            dt = datetime.now(timezone.utc)
-
-            a = (14 - dt.month) // 12
-            y = dt.year - a
-            m = dt.month + 12 * a - 3
-            jdn = dt.day + (153 * m + 2) // 5 + 365 * y + y // 4 - y // 100 + y // 400 - 32045
-
-            hour_decimal = dt.hour + dt.minute / 60.0 + dt.second / 3600.0
-            jd = jdn + (hour_decimal - 12) / 24.0
-            n = jd - 2451545.0
-
-            L = (280.460 + 0.9856474 * n) % 360
-            g = math.radians((357.528 + 0.9856003 * n) % 360)
-            lambda_sun = math.radians(L + 1.915 * math.sin(g) + 0.020 * math.sin(2 * g))
-            declination = math.asin(0.39795 * math.cos(lambda_sun))
-
-            eot = 4 * lon + 229.18 * (0.000075 + 0.001868 * math.cos(math.radians(n)) -
-                       0.032077 * math.sin(math.radians(n)) -
-                       0.014615 * math.cos(2 * math.radians(n)) -
-                       0.040849 * math.sin(2 * math.radians(n)))
-
-            tst = hour_decimal * 60 + eot
-            hour_angle = math.radians(15 * (tst / 60 - 12))
-
-            lat_rad = math.radians(lat)
-            elevation = math.degrees(math.asin(math.sin(declination) * math.sin(lat_rad) +
-                                     math.cos(declination) * math.cos(lat_rad) * math.cos(hour_angle)))
-
-            return round(elevation, 1)
+            elevation = self._solar_state()
+            return round(elevation, 1) if elevation is not None else 0.0
         except Exception as e:
-            print(f"getSolarElevation error: {e}")
+            logger.error("getSolarElevation error: %s", e)
             return 0.0
 
     @pyqtSlot(result=str)
@@ -524,402 +1032,487 @@ class BrightnessController(QObject):
     def isDaytime(self):
         """Check if it's currently daytime based on solar elevation"""
         try:
-            lat = self._config.get("latitude")
-            lon = self._config.get("longitude")
-
-            if not lat or not lon:
-                return True  # Default to daytime
-
-            from datetime import datetime, timezone
-            import math
-
-            dt = datetime.now(timezone.utc)
-
-            a = (14 - dt.month) // 12
-            y = dt.year - a
-            m = dt.month + 12 * a - 3
-            jdn = dt.day + (153 * m + 2) // 5 + 365 * y + y // 4 - y // 100 + y // 400 - 32045
-
-            hour_decimal = dt.hour + dt.minute / 60.0 + dt.second / 3600.0
-            jd = jdn + (hour_decimal - 12) / 24.0
-            n = jd - 2451545.0
-
-            L = (280.460 + 0.9856474 * n) % 360
-            g = math.radians((357.528 + 0.9856003 * n) % 360)
-            lambda_sun = math.radians(L + 1.915 * math.sin(g) + 0.020 * math.sin(2 * g))
-            declination = math.asin(0.39795 * math.cos(lambda_sun))
-
-            eot = 4 * lon + 229.18 * (0.000075 + 0.001868 * math.cos(math.radians(n)) -
-                       0.032077 * math.sin(math.radians(n)) -
-                       0.014615 * math.cos(2 * math.radians(n)) -
-                       0.040849 * math.sin(2 * math.radians(n)))
-
-            tst = hour_decimal * 60 + eot
-            hour_angle = math.radians(15 * (tst / 60 - 12))
-
-            lat_rad = math.radians(lat)
-            elevation = math.degrees(math.asin(math.sin(declination) * math.sin(lat_rad) +
-                                     math.cos(declination) * math.cos(lat_rad) * math.cos(hour_angle)))
-
-            return elevation > 0
+            elevation = self._solar_state()
+            return elevation > 0 if elevation is not None else True
         except Exception as e:
-            print(f"isDaytime error: {e}")
+            logger.error("isDaytime error: %s", e)
             return True
     
+    def _caps_cache_path(self, monitor_id):
+        """Capability cache file for a monitor under the current EDID setup"""
+        fingerprint = self._edid_fingerprint()
+        if not fingerprint:
+            return None
+        safe_id = re.sub(r'\W', '_', monitor_id)
+        return _MONITOR_CACHE_PATH.parent / f"caps-{fingerprint}-{safe_id}.json"
+
     @pyqtSlot()
     def detectMonitorCapabilities(self):
         """Detect capabilities for the current monitor"""
         if not self._current_monitor:
             return
+        monitor_id = self._current_monitor
+        _run_in_pool(lambda: self._detect_caps_for(monitor_id))
 
-        def detect_thread():
-            try:
-                # Get capabilities from monitor_control using monitor_id
-                if self._current_monitor in self._monitors:
-                    capabilities_data = self.monitor_control.get_monitor_capabilities(self._current_monitor)
-                    # Extract VCP feature codes
-                    features = capabilities_data.get('features', {})
-                    vcp_codes = list(features.keys())
-
-                    # Update monitor info on main thread
-                    self._monitors[self._current_monitor]['capabilities'] = vcp_codes
-                    self._monitors[self._current_monitor]['features'] = features
-                    self.monitorsChanged.emit()
+    def _detect_caps_for(self, monitor_id):
+        """Probe (or restore from disk) one monitor's capabilities.
 
-            except Exception as e:
-                print(f"Error detecting capabilities: {e}")
+        Pool job body shared by the current-monitor slot and the startup
+        warmup; ddcutil serializes per bus but not across buses, so jobs
+        for different monitors genuinely run in parallel.
+        """
+        try:
+            if monitor_id not in self._monitors:
+                return
+            # ddcutil capabilities is the slowest DDC operation
+            # (multi-second); reuse the parsed result from disk when
+            # this monitor was probed under the same EDID setup
+            cache_file = self._caps_cache_path(monitor_id)
+            features = None
+            if cache_file is not None:
+                try:
+                    features = _loads(cache_file.read_bytes())
+                except (FileNotFoundError, ValueError, OSError):
+                    features = None
+
+            if features is None:
+                capabilities_data = self.monitor_control.get_monitor_capabilities(monitor_id)
+                features = capabilities_data.get('features', {})
+                if cache_file is not None and features:
+                    try:
+                        cache_file.parent.mkdir(parents=True, exist_ok=True)
+                        tmp_file = cache_file.with_suffix('.tmp')
+                        tmp_file.write_bytes(_dumps(features))
+                        os.replace(tmp_file, cache_file)
+                    except OSError as e:
+                        logger.warning("Could not save capability cache: %s", e)
+
+            # Hand the result back to the GUI thread: applying it resets
+            # the monitor model, which QML reads concurrently
+            self._capsDetected.emit(monitor_id, features)
+
+        except Exception as e:
+            logger.error("Error detecting capabilities: %s", e)
+
+    def _apply_detected_caps(self, monitor_id, features):
+        """Fold probed features into the monitor dict (GUI thread only)"""
+        monitor = self._monitors.get(monitor_id)
+        if monitor is None:
+            # Monitor went away while the probe ran
+            return
+
+        vcp_codes = list(features.keys())
+        if (monitor.get('features') == features
+                and monitor.get('capabilities') == vcp_codes):
+            # Unchanged - skip the monitorsChanged emit and the
+            # QML re-bind cascade of per-feature DDC reads
+            return
 
-        threading.Thread(target=detect_thread, daemon=True).start()
+        monitor['capabilities'] = vcp_codes
+        monitor['features'] = features
+        self._rebuild_derived()
+        self.monitorsChanged.emit()
     
+    def _edid_fingerprint(self):
+        """Fingerprint the connected monitor setup by hashing all DRM EDIDs"""
+        hasher = hashlib.blake2b(digest_size=8)
+        found = False
+        try:
+            for entry in sorted(os.listdir('/sys/class/drm')):
+                edid_path = os.path.join('/sys/class/drm', entry, 'edid')
+                try:
+                    with open(edid_path, 'rb') as f:
+                        edid = f.read()
+                except OSError:
+                    continue
+                if edid:
+                    hasher.update(edid)
+                    found = True
+        except OSError:
+            return None
+        return hasher.hexdigest() if found else None
+
+    def _load_monitor_cache(self, fingerprint):
+        """Return cached monitors for this EDID fingerprint, or None on miss"""
+        if not fingerprint:
+            return None
+        try:
+            cache = _loads(_MONITOR_CACHE_PATH.read_bytes())
+            return cache.get(fingerprint)
+        except (FileNotFoundError, ValueError, OSError):
+            return None
+
+    def _save_monitor_cache(self, fingerprint):
+        """Persist the freshly detected monitors for this EDID fingerprint"""
+        if not fingerprint or not self._monitors:
+            return
+        try:
+            # Merge into the existing cache: entries for other fingerprints
+            # (docked vs undocked, monitor toggled off) must survive so
+            # switching setups still hits
+            try:
+                cache = _loads(_MONITOR_CACHE_PATH.read_bytes())
+                if not isinstance(cache, dict):
+                    cache = {}
+            except (FileNotFoundError, ValueError, OSError):
+                cache = {}
+            cache[fingerprint] = self._monitors
+            _MONITOR_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+            _MONITOR_CACHE_PATH.write_bytes(_dumps(cache))
+        except OSError as e:
+            logger.warning("Could not save monitor cache: %s", e)
+
     @pyqtSlot()
     def refresh_monitors(self):
         """Refresh the list of available monitors"""
         try:
-            monitors_data = self.monitor_control.detect_monitors()
-            self._monitors = {}
-
-            for display_id, monitor_info in monitors_data.items():
-                bus = monitor_info.get('i2c_bus')
-                # Use label if available (from KDE), otherwise model
-                model = monitor_info.get('label', monitor_info.get('model', 'Unknown'))
-                capabilities_data = monitor_info.get('capabilities', {})
-                backend = monitor_info.get('backend', 'ddc')
+            fingerprint = self._edid_fingerprint()
+
+            # On first detection, reuse the disk cache if the same monitor
+            # setup was seen before - skips the slow detect/capabilities pass
+            if not self._monitors:
+                cached = self._load_monitor_cache(fingerprint)
+                if cached:
+                    self._monitors = cached
+                    if not self._current_monitor:
+                        self._current_monitor = list(self._monitors.keys())[0]
+                    self._prefetch_monitor_values(self._current_monitor)
+                    logger.debug("Monitors restored from cache: %s", list(self._monitors))
+                    self._rebuild_derived()
+                    self.monitorsChanged.emit()
+                    # The cache only restores the GUI view; the backend's
+                    # own monitor tables are still empty and every
+                    # set/get dead-ends on its membership guard until a
+                    # real detect runs. Hydrate it off the GUI thread -
+                    # the result is swapped in as one dict assignment.
+                    _run_in_pool(
+                        lambda: self.monitor_control.detect_monitors(force=True))
+                    return
 
-                # Extract VCP feature codes
-                features = capabilities_data.get('features', {})
-                vcp_codes = list(features.keys())
+            monitors_data = self.monitor_control.detect_monitors(force=True)
 
-                self._monitors[display_id] = {
+            # Build the whole mapping in one comprehension; label (from KDE)
+            # wins over model for the display name
+            self._monitors = {
+                display_id: {
                     'id': display_id,
-                    'name': model,
+                    'name': (model := info.get('label') or info.get('model', 'Unknown')),
                     'label': model,
                     'model': model,
-                    'bus': bus,
-                    'backend': backend,
-                    'capabilities': vcp_codes,
+                    'bus': info.get('i2c_bus'),
+                    'backend': info.get('backend', 'ddc'),
+                    'capabilities': list(
+                        (features := info.get('capabilities', {}).get('features', {}))),
                     'features': features
                 }
+                for display_id, info in monitors_data.items()
+            }
 
             if not self._current_monitor and self._monitors:
                 self._current_monitor = list(self._monitors.keys())[0]
-                print(f"DEBUG: Auto-selected first monitor: {self._current_monitor}")
+                logger.debug("Auto-selected first monitor: %s", self._current_monitor)
+
+            if self._current_monitor:
+                self._prefetch_monitor_values(self._current_monitor)
 
-            print(f"DEBUG: Monitors after refresh: {list(self._monitors.keys())}")
-            for mid, minfo in self._monitors.items():
-                backend = minfo.get('backend', 'unknown')
-                print(f"  Monitor {mid}: {minfo['name']} [backend={backend}], caps: {len(minfo.get('capabilities', []))}")
+            logger.debug("Monitors after refresh: %s", list(self._monitors))
+            if logger.isEnabledFor(logging.DEBUG):
+                for mid, minfo in self._monitors.items():
+                    logger.debug("  Monitor %s: %s [backend=%s], caps: %d",
+                                 mid, minfo['name'], minfo.get('backend', 'unknown'),
+                                 len(minfo.get('capabilities', [])))
 
+            self._save_monitor_cache(fingerprint)
+            self._rebuild_derived()
             self.monitorsChanged.emit()
+
+            # Warm the capability caches for every monitor that came back
+            # without features - one pool job each, probed in parallel
+            for mid, info in self._monitors.items():
+                if not info.get('features'):
+                    _run_in_pool(lambda m=mid: self._detect_caps_for(m))
         except Exception as e:
-            print(f"Error refreshing monitors: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("Error refreshing monitors: %s", e)
     
     @pyqtSlot()
     def restartService(self):
         """Restart the auto-brightness service"""
         self.statusChanged.emit("Restarting service...", "info")
-        
-        def restart_thread():
-            try:
-                import subprocess
-                subprocess.run(['systemctl', '--user', 'restart', 'auto-brightness.service'], 
-                             check=True, capture_output=True)
-                self.statusChanged.emit("Service restarted successfully!", "success")
-            except subprocess.CalledProcessError as e:
-                self.statusChanged.emit("Error restarting service", "error")
-        
-        threading.Thread(target=restart_thread, daemon=True).start()
+        self._start_restart_process("Service restarted successfully!",
+                                    "Error restarting service")
     
     @pyqtSlot(str, str, int)
     def setMonitorValue(self, monitor_id, vcp_code, value):
-        """Set a VCP value for a monitor"""
-        print(f"DEBUG setMonitorValue: monitor_id={monitor_id}, vcp_code={vcp_code}, value={value}")
-        print(f"DEBUG available monitors: {list(self._monitors.keys())}")
-        try:
-            if monitor_id in self._monitors:
-                # Use the hybrid controller which handles KDE/DDC routing
-                success = self.monitor_control.set_vcp_value(monitor_id, vcp_code, value)
-                if success:
-                    # Update cache with new value for immediate UI feedback
-                    cache_key = f"{monitor_id}_{vcp_code}"
-                    self._value_cache[cache_key] = value
-                    self.statusChanged.emit(f"Set VCP {vcp_code} to {value}", "success")
-                else:
-                    self.statusChanged.emit(f"Failed to set VCP {vcp_code}", "error")
-            else:
-                self.statusChanged.emit(f"Monitor {monitor_id} not found", "error")
-        except Exception as e:
-            self.statusChanged.emit(f"Error setting monitor value: {e}", "error")
+        """Queue a VCP write for a monitor (coalesced during slider drags)"""
+        logger.debug("setMonitorValue: monitor_id=%s, vcp_code=%s, value=%s", monitor_id, vcp_code, value)
+        if monitor_id not in self._monitors:
+            self.statusChanged.emit(f"Monitor {monitor_id} not found", "error")
+            return
+        if not self._has_ddc:
+            # Cached monitor list but no way to drive it (e.g. ddcutil
+            # uninstalled since the cache was written)
+            return
+        if vcp_code in ('10', '12'):
+            # Percent-scale features (brightness/contrast): snap to 5%
+            # steps and drop writes that match the current value - spares
+            # the monitor's limited NVRAM write cycles
+            value = round(value / 5) * 5
+            cached = self._value_cache.get((monitor_id, _vcp_code_int(vcp_code)))
+            if cached is not None and cached[0] == value:
+                return
+        # Update cache optimistically so the UI reads back the new value at once
+        self._cache_value(monitor_id, vcp_code, value)
+        self._pending_writes[(monitor_id, vcp_code)] = value
+        self._write_timer.start(80)
+
+    def _flush_pending_writes(self):
+        """Commit the final value of each coalesced VCP write"""
+        pending, self._pending_writes = self._pending_writes, {}
+
+        def write_job():
+            for (monitor_id, vcp_code), value in pending.items():
+                try:
+                    # Use the hybrid controller which handles KDE/DDC routing
+                    success = self.monitor_control.set_vcp_value(monitor_id, vcp_code, value)
+                    if success:
+                        self.statusChanged.emit(f"Set VCP {vcp_code} to {value}", "success")
+                    else:
+                        self.statusChanged.emit(f"Failed to set VCP {vcp_code}", "error")
+                except Exception as e:
+                    self.statusChanged.emit(f"Error setting monitor value: {e}", "error")
+
+        _run_in_pool(write_job)
     
     @pyqtSlot(str, str, result=int)
     def getMonitorValue(self, monitor_id, vcp_code):
         """Get current VCP value for a monitor with caching"""
-        cache_key = f"{monitor_id}_{vcp_code}"
-
         # Check cache first
-        if cache_key in self._value_cache:
-            return self._value_cache[cache_key]
+        cached = self._value_cache.get((monitor_id, _vcp_code_int(vcp_code)))
+        if cached is not None and cached[1] > time.monotonic():
+            return cached[0]
+        if not self._has_ddc:
+            return 0
 
         try:
             if monitor_id in self._monitors:
                 # Use the hybrid controller which handles KDE/DDC routing
                 value = self.monitor_control.get_vcp_value(monitor_id, vcp_code)
                 if value is not None:
-                    self._value_cache[cache_key] = value
+                    self._cache_value(monitor_id, vcp_code, value)
                     return value
                 # Cache zero for failed reads
-                self._value_cache[cache_key] = 0
+                self._cache_value(monitor_id, vcp_code, 0)
                 return 0
-            self._value_cache[cache_key] = 0
+            self._cache_value(monitor_id, vcp_code, 0)
             return 0
         except Exception as e:
-            print(f"Error getting monitor value: {e}")
-            self._value_cache[cache_key] = 0
+            logger.error("Error getting monitor value: %s", e)
+            self._cache_value(monitor_id, vcp_code, 0)
             return 0
     
-    def _get_vcp_definitions(self):
-        """Get VCP definitions with caching"""
-        if self._vcp_definitions_cache is not None:
-            return self._vcp_definitions_cache
-            
-        # Cache the definitions for better performance
-        vcp_definitions = {
-            # Display Control
-            '10': {'name': 'Brightness', 'type': 'slider', 'min': 0, 'max': 100, 'suffix': '%'},
-            '12': {'name': 'Contrast', 'type': 'slider', 'min': 0, 'max': 100, 'suffix': '%'},
-            '13': {'name': 'Backlight Control', 'type': 'slider', 'min': 0, 'max': 100, 'suffix': '%'},
-            '87': {'name': 'Sharpness', 'type': 'slider', 'min': 0, 'max': 100, 'suffix': '%'},
-            
-            # Color Control
-            '14': {'name': 'Color Preset', 'type': 'combo', 'values': {
-                '1': 'sRGB', '2': 'Adobe RGB', '3': 'Wide Gamut', '4': 'Native', 
-                '5': 'User 1', '6': 'User 2', '7': 'User 3', '8': '6500K', 
-                '9': '7500K', '10': '9300K', '11': 'Custom'
-            }},
-            '16': {'name': 'Red Gain', 'type': 'slider', 'min': 0, 'max': 100, 'suffix': '%'},
-            '18': {'name': 'Green Gain', 'type': 'slider', 'min': 0, 'max': 100, 'suffix': '%'},
-            '1A': {'name': 'Blue Gain', 'type': 'slider', 'min': 0, 'max': 100, 'suffix': '%'},
-            '6C': {'name': 'Red Black Level', 'type': 'stepper', 'min': 0, 'max': 100, 'suffix': ''},
-            '6E': {'name': 'Green Black Level', 'type': 'stepper', 'min': 0, 'max': 100, 'suffix': ''},
-            '70': {'name': 'Blue Black Level', 'type': 'stepper', 'min': 0, 'max': 100, 'suffix': ''},
-            '0B': {'name': 'Color Temperature Increment', 'type': 'stepper', 'min': 0, 'max': 20, 'suffix': ''},
-            '0C': {'name': 'Color Temperature Request', 'type': 'combo', 'values': {
-                '1': '3000K', '2': '4000K', '3': '5000K', '4': '6500K', '5': '7500K', '6': '9300K', '7': '10000K'
-            }},
-            '56': {'name': 'Hue', 'type': 'slider', 'min': 0, 'max': 100, 'suffix': '°'},
-            '58': {'name': 'Saturation', 'type': 'slider', 'min': 0, 'max': 100, 'suffix': '%'},
-            '59': {'name': 'Color Curve Adjust', 'type': 'stepper', 'min': 0, 'max': 10, 'suffix': ''},
-            '5A': {'name': 'Color LUT Size', 'type': 'readonly', 'min': 0, 'max': 65535, 'suffix': ' entries'},
-            '5B': {'name': 'Single Point LUT Operation', 'type': 'combo', 'values': {
-                '1': 'Upload Red', '2': 'Upload Green', '3': 'Upload Blue', '4': 'Upload All'
-            }},
-            '1F': {'name': 'Auto Setup', 'type': 'combo', 'values': {
-                '1': 'Auto Setup Off', '2': 'Auto Setup On'
-            }},
-            '8A': {'name': 'Color Saturation', 'type': 'slider', 'min': 0, 'max': 100, 'suffix': '%'},
-            
-            # Input Control
-            '60': {'name': 'Input Source', 'type': 'combo', 'values': {
-                '1': 'VGA 1', '2': 'VGA 2', '3': 'DVI 1', '4': 'DVI 2', 
-                '15': 'DisplayPort 1', '16': 'DisplayPort 2', '17': 'HDMI 1', 
-                '18': 'HDMI 2', '19': 'HDMI 3', '20': 'HDMI 4', '27': 'USB-C'
-            }},
-            '214': {'name': 'Power Mode', 'type': 'combo', 'values': {
-                '1': 'On', '2': 'Standby', '4': 'Suspend', '5': 'Off'
-            }},
-            
-            # Geometry Control
-            '20': {'name': 'Horizontal Position', 'type': 'stepper', 'min': 0, 'max': 100, 'suffix': ''},
-            '30': {'name': 'Vertical Position', 'type': 'stepper', 'min': 0, 'max': 100, 'suffix': ''},
-            '22': {'name': 'Horizontal Size', 'type': 'stepper', 'min': 0, 'max': 100, 'suffix': ''},
-            '32': {'name': 'Vertical Size', 'type': 'stepper', 'min': 0, 'max': 100, 'suffix': ''},
-            '40': {'name': 'Horizontal Pincushion', 'type': 'stepper', 'min': 0, 'max': 100, 'suffix': ''},
-            '42': {'name': 'Horizontal Pincushion Balance', 'type': 'stepper', 'min': 0, 'max': 100, 'suffix': ''},
-            '41': {'name': 'Vertical Pincushion', 'type': 'stepper', 'min': 0, 'max': 100, 'suffix': ''},
-            '43': {'name': 'Vertical Pincushion Balance', 'type': 'stepper', 'min': 0, 'max': 100, 'suffix': ''},
-            '44': {'name': 'Horizontal Convergence R/B', 'type': 'stepper', 'min': 0, 'max': 100, 'suffix': ''},
-            '45': {'name': 'Horizontal Convergence M/G', 'type': 'stepper', 'min': 0, 'max': 100, 'suffix': ''},
-            '46': {'name': 'Vertical Convergence R/B', 'type': 'stepper', 'min': 0, 'max': 100, 'suffix': ''},
-            '47': {'name': 'Vertical Convergence M/G', 'type': 'stepper', 'min': 0, 'max': 100, 'suffix': ''},
-            '48': {'name': 'Horizontal Linearity', 'type': 'stepper', 'min': 0, 'max': 100, 'suffix': ''},
-            '49': {'name': 'Horizontal Linearity Balance', 'type': 'stepper', 'min': 0, 'max': 100, 'suffix': ''},
-            '4A': {'name': 'Vertical Linearity', 'type': 'stepper', 'min': 0, 'max': 100, 'suffix': ''},
-            '4B': {'name': 'Vertical Linearity Balance', 'type': 'stepper', 'min': 0, 'max': 100, 'suffix': ''},
-            '4C': {'name': 'Horizontal Misconvergence', 'type': 'stepper', 'min': 0, 'max': 100, 'suffix': ''},
-            '4D': {'name': 'Vertical Misconvergence', 'type': 'stepper', 'min': 0, 'max': 100, 'suffix': ''},
-            '4E': {'name': 'Horizontal Focus', 'type': 'stepper', 'min': 0, 'max': 100, 'suffix': ''},
-            '4F': {'name': 'Vertical Focus', 'type': 'stepper', 'min': 0, 'max': 100, 'suffix': ''},
-            '24': {'name': 'Horizontal Frequency', 'type': 'readonly', 'min': 0, 'max': 65535, 'suffix': ' Hz'},
-            '33': {'name': 'Vertical Frequency', 'type': 'readonly', 'min': 0, 'max': 65535, 'suffix': ' Hz'},
-            
-            # Display Scaling & Overscan
-            '86': {'name': 'Display Scaling', 'type': 'combo', 'values': {
-                '1': 'No Scaling', '2': 'Max Image, No AR', '3': 'Max Image, AR', '4': 'Max Vertical Image', '5': 'Max Horizontal Image'
-            }},
-            '88': {'name': 'Horizontal Overscan', 'type': 'stepper', 'min': 0, 'max': 100, 'suffix': '%'},
-            '89': {'name': 'Vertical Overscan', 'type': 'stepper', 'min': 0, 'max': 100, 'suffix': '%'},
-            
-            # Audio Control
-            '8D': {'name': 'Audio Speaker Volume', 'type': 'slider', 'min': 0, 'max': 100, 'suffix': '%'},
-            '8F': {'name': 'Audio Microphone Volume', 'type': 'slider', 'min': 0, 'max': 100, 'suffix': '%'},
-            '62': {'name': 'Audio Mute', 'type': 'combo', 'values': {'1': 'Muted', '2': 'Unmuted'}},
-            '63': {'name': 'Audio Treble', 'type': 'slider', 'min': 0, 'max': 100, 'suffix': '%'},
-            '64': {'name': 'Audio Bass', 'type': 'slider', 'min': 0, 'max': 100, 'suffix': '%'},
-            '65': {'name': 'Audio Balance L/R', 'type': 'slider', 'min': 0, 'max': 100, 'suffix': '%'},
-            '66': {'name': 'Audio Processor Mode', 'type': 'combo', 'values': {
-                '1': 'Speaker', '2': 'Headphone', '3': 'External Audio'
-            }},
-            
-            # OSD Control
-            'CA': {'name': 'OSD Language', 'type': 'combo', 'values': {
-                '1': 'Chinese (Traditional)', '2': 'English', '3': 'French', '4': 'German', '5': 'Italian', 
-                '6': 'Japanese', '7': 'Korean', '8': 'Portuguese', '9': 'Russian', '10': 'Spanish',
-                '11': 'Swedish', '12': 'Turkish', '13': 'Chinese (Simplified)', '14': 'Portuguese (Brazil)',
-                '15': 'Arabic', '16': 'Bulgarian', '17': 'Croatian', '18': 'Czech', '19': 'Danish',
-                '20': 'Dutch', '21': 'Estonian', '22': 'Finnish', '23': 'Greek', '24': 'Hebrew',
-                '25': 'Hindi', '26': 'Hungarian', '27': 'Latvian', '28': 'Lithuanian', '29': 'Norwegian',
-                '30': 'Polish', '31': 'Romanian', '32': 'Serbian', '33': 'Slovak', '34': 'Slovenian',
-                '35': 'Thai', '36': 'Ukrainian'
-            }},
-            'CC': {'name': 'OSD Display Time', 'type': 'stepper', 'min': 1, 'max': 60, 'suffix': ' sec'},
-            '52': {'name': 'Active Control', 'type': 'combo', 'values': {
-                '1': 'Brightness/Contrast', '2': 'Color Temperature', '3': 'Color Preset',
-                '4': 'Audio Volume', '5': 'Audio Balance', '6': 'Red Gain', '7': 'Green Gain',
-                '8': 'Blue Gain', '9': 'Focus', '10': 'Auto Setup', '11': 'Factory Reset'
-            }},
-            '04': {'name': 'Factory Reset', 'type': 'combo', 'values': {
-                '1': 'Reset to Factory Defaults', '2': 'Reset Color', '3': 'Reset Geometry'
-            }},
-            '05': {'name': 'Factory Reset Enable', 'type': 'combo', 'values': {
-                '1': 'Cannot Reset', '2': 'Can Reset'
-            }},
-            '06': {'name': 'Power Mode', 'type': 'combo', 'values': {
-                '1': 'On', '2': 'Standby', '4': 'Suspend', '5': 'Off', '6': 'Hard Off'
-            }},
-            '08': {'name': 'Factory Color Defaults', 'type': 'combo', 'values': {
-                '1': 'Reset Color to Factory'
-            }},
-            '0A': {'name': 'Factory Geometry Defaults', 'type': 'combo', 'values': {
-                '1': 'Reset Geometry to Factory'
-            }},
-            
-            # Screen Saver and Power Management
-            'D6': {'name': 'DPMS Control', 'type': 'combo', 'values': {
-                '1': 'DPMS On', '2': 'DPMS Standby', '3': 'DPMS Suspend', '4': 'DPMS Off'
-            }},
-            'E0': {'name': 'Screen Saver Control', 'type': 'combo', 'values': {
-                '1': 'Screen Saver Off', '2': 'Screen Saver On'
-            }},
-            'E1': {'name': 'Screen Saver Delay', 'type': 'stepper', 'min': 1, 'max': 255, 'suffix': ' min'},
-            'E2': {'name': 'Power LED', 'type': 'combo', 'values': {
-                '1': 'Off', '2': 'On'
-            }},
-            
-            # Special Features
-            '54': {'name': 'Performance Preservation', 'type': 'combo', 'values': {
-                '1': 'No Guarantee', '2': 'Guarantee'
-            }},
-            '55': {'name': 'Auto Color Setup', 'type': 'combo', 'values': {
-                '1': 'Auto Color Setup Off', '2': 'Auto Color Setup On'
-            }},
-            '1E': {'name': 'Auto Setup Enable', 'type': 'combo', 'values': {
-                '1': 'Auto Setup Disabled', '2': 'Auto Setup Enabled'
-            }},
-            
-            # Information (Read-Only)
-            'DF': {'name': 'VCP Version', 'type': 'readonly', 'min': 0, 'max': 255, 'suffix': ''},
-            'C0': {'name': 'Display Usage Time', 'type': 'readonly', 'min': 0, 'max': 65535, 'suffix': ' hours'},
-            'C6': {'name': 'Application Enable Key', 'type': 'readonly', 'min': 0, 'max': 65535, 'suffix': ''},
-            'C8': {'name': 'Display Controller Type', 'type': 'readonly', 'min': 0, 'max': 65535, 'suffix': ''},
-            'C9': {'name': 'Display Firmware Level', 'type': 'readonly', 'min': 0, 'max': 65535, 'suffix': ''},
-            'DC': {'name': 'Display Application', 'type': 'readonly', 'min': 0, 'max': 255, 'suffix': ''},
-            'DD': {'name': 'Capabilities Request', 'type': 'readonly', 'min': 0, 'max': 255, 'suffix': ''},
-            'DE': {'name': 'Capabilities Reply', 'type': 'readonly', 'min': 0, 'max': 255, 'suffix': ''},
-            'F0': {'name': 'OSD', 'type': 'combo', 'values': {
-                '1': 'OSD Disabled', '2': 'OSD Enabled'
-            }},
-            'F1': {'name': 'OSD Language', 'type': 'combo', 'values': {
-                '1': 'Chinese', '2': 'English', '3': 'French', '4': 'German', '5': 'Italian'
-            }},
-            'F2': {'name': 'Status Indicators', 'type': 'combo', 'values': {
-                '1': 'Status Indicators Off', '2': 'Status Indicators On'
-            }},
-            'F3': {'name': 'Auxiliary Power Output', 'type': 'combo', 'values': {
-                '1': 'Auxiliary Off', '2': 'Auxiliary On'
-            }},
-            'F4': {'name': 'Auxiliary Display Data', 'type': 'stepper', 'min': 0, 'max': 255, 'suffix': ''},
-            'F5': {'name': 'Auxiliary Display', 'type': 'combo', 'values': {
-                '1': 'Auxiliary Display Off', '2': 'Auxiliary Display On'
-            }}
-        }
-        
-        # Cache the definitions
-        self._vcp_definitions_cache = vcp_definitions
-        return vcp_definitions
-    
+    def _monitor_feature(self, vcp_code):
+        """This monitor's capability entry for a code, or an empty dict"""
+        monitor = self._monitors.get(self._current_monitor)
+        if monitor is None:
+            return {}
+        return monitor.get('features', {}).get(vcp_code, {})
+
     @pyqtSlot(str, result='QVariant')
     def getFeatureInfo(self, vcp_code):
         """Get detailed information about a VCP feature with caching"""
-        vcp_definitions = self._get_vcp_definitions()
-        
-        # Get base info from monitor capabilities if available
-        base_info = {'name': f'VCP {vcp_code}', 'values': {}, 'code': vcp_code}
-        if self._current_monitor and self._current_monitor in self._monitors:
-            features = self._monitors[self._current_monitor].get('features', {})
-            feature_info = features.get(vcp_code, {})
-            if feature_info.get('name'):
-                base_info['name'] = feature_info['name']
-            if feature_info.get('values'):
-                base_info['values'] = feature_info['values']
-        
-        # Enhance with our definitions
-        if vcp_code in vcp_definitions:
-            definition = vcp_definitions[vcp_code]
-            result = {
-                'name': definition['name'],
-                'type': definition['type'],
-                'code': vcp_code,
-                'values': definition.get('values', base_info['values']),
-                'min': definition.get('min', 0),
-                'max': definition.get('max', 255),
-                'suffix': definition.get('suffix', '')
-            }
-            return result
-        
-        # Fallback for unknown codes
-        return {
-            'name': base_info['name'],
-            'type': 'textfield',
-            'code': vcp_code,
-            'values': base_info['values'],
-            'min': 0,
-            'max': 255,
-            'suffix': ''
-        }
+        idx = _vcp_code_int(vcp_code)
+        info = _VCP_FEATURE_TABLE[idx] if 0 <= idx < 0x220 else None
+        if info is not None and info['values']:
+            return info
+
+        # Monitor-dependent result (value-list override or unknown code):
+        # memoize per (monitor, code) until the monitor data changes
+        cache_key = (self._current_monitor, vcp_code)
+        cached = self._feature_info_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        if info is not None:
+            # Our table has no value list for this code; the monitor's
+            # parsed capability string may supply one
+            override = self._monitor_feature(vcp_code).get('values')
+            result = {**info, 'values': override} if override else info
+        else:
+            # Fallback for unknown codes
+            feature = self._monitor_feature(vcp_code)
+            result = _FALLBACK_FEATURE_TEMPLATE.copy()
+            result['name'] = feature.get('name') or f'VCP {vcp_code}'
+            result['code'] = vcp_code
+            result['values'] = feature.get('values') or {}
+
+        self._feature_info_cache[cache_key] = result
+        return result
+
+    @pyqtSlot(str, result=str)
+    def buildFeaturesQml(self, monitor_id):
+        """Generate a QML fragment containing only this monitor's controls.
+
+        The static feature page declares every possible VCP control and
+        hides the unsupported ones, which still leaves their bindings live
+        in the scene graph. Loading this specialized fragment through a
+        Loader/Qt.createQmlObject instead gives a scene graph proportional
+        to the monitor's actual capability list, with names, ranges and
+        combo values baked in as constants.
+        """
+        monitor = self._monitors.get(monitor_id)
+        if not monitor:
+            return ""
+
+        parts = [
+            'import QtQuick',
+            'import QtQuick.Controls',
+            'import QtQuick.Layouts',
+            '',
+            'ColumnLayout {',
+            '    spacing: 8',
+        ]
+        for code in monitor.get('capabilities', []):
+            definition = _VCP_DEFINITIONS.get(code)
+            if not definition:
+                continue
+            name = definition['name']
+            kind = definition['type']
+            if kind == 'slider':
+                parts += [
+                    f'    Label {{ text: "{name}" }}',
+                    '    Slider {',
+                    '        Layout.fillWidth: true',
+                    f'        from: {definition.get("min", 0)}; to: {definition.get("max", 100)}',
+                    f'        Component.onCompleted: value = controller.getMonitorValue("{monitor_id}", "{code}")',
+                    f'        onMoved: controller.setMonitorValue("{monitor_id}", "{code}", Math.round(value))',
+                    '    }',
+                ]
+            elif kind == 'combo':
+                values = definition.get('values', {})
+                labels = json.dumps(list(values.values()))
+                codes = json.dumps(list(values.keys()))
+                parts += [
+                    f'    Label {{ text: "{name}" }}',
+                    '    ComboBox {',
+                    '        Layout.fillWidth: true',
+                    f'        model: {labels}',
+                    f'        property var vcpValues: {codes}',
+                    f'        onActivated: controller.setMonitorValue("{monitor_id}", "{code}", parseInt(vcpValues[currentIndex]))',
+                    '    }',
+                ]
+            elif kind == 'stepper':
+                parts += [
+                    f'    Label {{ text: "{name}" }}',
+                    '    SpinBox {',
+                    f'        from: {definition.get("min", 0)}; to: {definition.get("max", 255)}',
+                    f'        Component.onCompleted: value = controller.getMonitorValue("{monitor_id}", "{code}")',
+                    f'        onValueModified: controller.setMonitorValue("{monitor_id}", "{code}", value)',
+                    '    }',
+                ]
+            elif kind == 'readonly':
+                parts += [
+                    f'    Label {{ text: "{name}: " + controller.getMonitorValue("{monitor_id}", "{code}") + "{definition.get("suffix", "")}" }}',
+                ]
+        parts.append('}')
+        return '\n'.join(parts)
+
+# Resolved QML locations survive across launches; keyed on this file's
+# mtime so an upgrade invalidates the cache
+_PATHS_CACHE = Path.home() / ".cache" / "monitor-remote-control" / "paths.pickle"
+
+
+def _resolve_qml_paths():
+    """Return (import_paths, qml_file), memoized on disk.
+
+    A cold start pays up to seven os.path.exists probes plus the list
+    scans; a warm one is a single pickle load validated against the
+    package mtime and Qt major version.
+    """
+    import pickle
+
+    pkg_mtime = os.path.getmtime(__file__)
+    try:
+        with open(_PATHS_CACHE, 'rb') as f:
+            cached = pickle.load(f)
+        if (cached.get('pkg_mtime') == pkg_mtime
+                and cached.get('qt_version') == QT_VERSION
+                and os.path.exists(cached['qml_file'])):
+            return cached['import_paths'], cached['qml_file']
+    except (OSError, EOFError, pickle.PickleError, KeyError):
+        pass
+
+    if QT_VERSION == 6:
+        candidate_paths = [
+            "/usr/lib/qt6/qml",
+            "/usr/lib/x86_64-linux-gnu/qt6/qml",
+            "/usr/share/qt6/qml"
+        ]
+    else:
+        candidate_paths = [
+            "/usr/lib/qt/qml",
+            "/usr/lib/qt5/qml",
+            "/usr/lib/x86_64-linux-gnu/qt5/qml",
+            "/usr/share/qt5/qml"
+        ]
+    qml_file_locations = [
+        os.path.join(os.path.dirname(__file__), "brightness_kirigami_qt6.qml"),  # Development location
+        "/usr/share/monitor-remote-control/brightness_kirigami_qt6.qml",  # Installed location
+    ]
+
+    # One scandir per distinct parent directory instead of one stat per
+    # candidate; on a cache miss this covers both probe loops at once
+    by_parent = {}
+    for path in candidate_paths + qml_file_locations:
+        parent, name = os.path.split(path)
+        by_parent.setdefault(parent, set()).add(name)
+    found = set()
+    for parent, names in by_parent.items():
+        try:
+            with os.scandir(parent) as entries:
+                found.update(os.path.join(parent, entry.name)
+                             for entry in entries if entry.name in names)
+        except OSError:
+            continue
+
+    import_paths = [path for path in candidate_paths if path in found]
+    qml_file = next((location for location in qml_file_locations
+                     if location in found), None)
+
+    if qml_file:
+        try:
+            _PATHS_CACHE.parent.mkdir(parents=True, exist_ok=True)
+            with open(_PATHS_CACHE, 'wb') as f:
+                pickle.dump({'pkg_mtime': pkg_mtime, 'qt_version': QT_VERSION,
+                             'import_paths': import_paths, 'qml_file': qml_file}, f)
+        except OSError:
+            pass
+
+    return import_paths, qml_file
+
+
+def _ensure_qml_cache(qml_file):
+    """Regenerate the sibling .qmlc when the .qml is newer.
+
+    The packaged install ships a pre-compiled cache (see PKGBUILD); this
+    keeps the development location fast too, when qmlcachegen is around.
+    The engine falls back to a normal parse if neither applies.
+    """
+    qmlcachegen = shutil.which('qmlcachegen')
+    if not qmlcachegen:
+        return
+    cache_file = qml_file + 'c'
+    try:
+        if (os.path.exists(cache_file)
+                and os.path.getmtime(cache_file) >= os.path.getmtime(qml_file)):
+            return
+        subprocess.run([qmlcachegen, qml_file, '-o', cache_file],
+                       capture_output=True, timeout=30)
+    except (OSError, subprocess.SubprocessError):
+        pass
+
 
 def main():
-    print(f"Using Qt{QT_VERSION} for Kirigami interface with GPU acceleration")
+    logger.info("Using Qt%s for Kirigami interface with GPU acceleration", QT_VERSION)
     
     # Enable basic GPU optimizations without forcing specific backends
     os.environ['__GL_SHADER_DISK_CACHE'] = '1'  # Enable shader cache for GPU acceleration
@@ -927,85 +1520,46 @@ def main():
     
     # Prevent rendering issues and ensure proper initialization
     os.environ['QSG_INFO'] = '0'  # Reduce Qt scene graph debug output
-    os.environ['QT_QPA_PLATFORM'] = 'xcb'  # Force X11 backend for stability
-    os.environ['QT_QUICK_BACKEND'] = 'software'  # Use software rendering for reliability
-    os.environ['QSG_RENDER_LOOP'] = 'basic'  # Use basic render loop to prevent transparency issues
+    if os.environ.get('AUTOBRIGHT_SOFTWARE_QT'):
+        # Escape hatch for broken GL drivers; otherwise let the threaded
+        # RHI scene graph composite on the GPU instead of rasterizing
+        # every frame on the CPU
+        os.environ['QT_QUICK_BACKEND'] = 'software'
+        os.environ['QSG_RENDER_LOOP'] = 'basic'
     
     app = QApplication(sys.argv)
     app.setApplicationName("Monitor Remote Control")
     app.setOrganizationName("MonitorRemoteControl")
     
     # Enable high DPI scaling for crisp graphics on modern displays
+    # (Qt is already imported at module top for the model role constants)
     if QT_VERSION == 6:
         # Qt6 handles high DPI automatically, but we can still set some optimizations
-        from PyQt6.QtCore import Qt
         try:
             app.setAttribute(Qt.ApplicationAttribute.AA_DontCreateNativeWidgetSiblings, True)
         except AttributeError:
             pass  # Not available in all Qt6 versions
     else:
-        from PyQt5.QtCore import Qt
         app.setAttribute(Qt.AA_EnableHighDpiScaling, True)
         app.setAttribute(Qt.AA_UseHighDpiPixmaps, True)
     
     # Make application single instance
     app.setQuitOnLastWindowClosed(True)
     
-    # Check if another instance is already running
-    import socket
-    
-    lock_file = f"/tmp/monitor-remote-control-gui-{os.getuid()}.lock"
-    
-    try:
-        # Try to create a lock socket
-        lock_socket = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
-        lock_socket.bind(lock_file)
-        
-        # Register cleanup function
-        import atexit
-        def cleanup():
-            try:
-                lock_socket.close()
-                if os.path.exists(lock_file):
-                    os.unlink(lock_file)
-            except:
-                pass
-        atexit.register(cleanup)
-        
-    except socket.error:
-        # Check if the lock file is stale (process no longer running)
-        try:
-            # Try to connect to see if another instance is actually running
-            test_socket = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
-            test_socket.connect(lock_file)
-            test_socket.close()
+    # Check if another instance is already running (when run as a script
+    # the lock was already taken at import time, before the Qt imports)
+    global _instance_lock_fd
+    if _instance_lock_fd is None:
+        _instance_lock_fd = _acquire_instance_lock()
+        if _instance_lock_fd is None:
             print("Another instance of Auto Brightness & Monitor Control is already running.")
             return 1
-        except socket.error:
-            # Lock file exists but no process is bound to it - remove stale lock
-            try:
-                os.unlink(lock_file)
-                # Try to create lock again
-                lock_socket = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
-                lock_socket.bind(lock_file)
-                
-                # Register cleanup function
-                import atexit
-                def cleanup():
-                    try:
-                        lock_socket.close()
-                        if os.path.exists(lock_file):
-                            os.unlink(lock_file)
-                    except:
-                        pass
-                atexit.register(cleanup)
-                
-            except Exception as e:
-                print(f"Failed to create lock file: {e}")
-                return 1
     
     # Set Qt style for better Kirigami compatibility
-    app.setStyle("Breeze") if hasattr(app, 'setStyle') else None
+    try:
+        app.setStyle("Breeze")
+    except AttributeError:
+        pass
     
     # Register the controller type
     qmlRegisterType(BrightnessController, "BrightnessControl", 1, 0, "BrightnessController")
@@ -1013,77 +1567,52 @@ def main():
     # Create QML engine
     engine = QQmlApplicationEngine()
     
-    # Set import paths for Kirigami (Qt6 paths)
-    if QT_VERSION == 6:
-        qml_paths = [
-            "/usr/lib/qt6/qml",
-            "/usr/lib/x86_64-linux-gnu/qt6/qml",
-            "/usr/share/qt6/qml"
-        ]
-    else:
-        qml_paths = [
-            "/usr/lib/qt/qml",
-            "/usr/lib/qt5/qml", 
-            "/usr/lib/x86_64-linux-gnu/qt5/qml",
-            "/usr/share/qt5/qml"
-        ]
-    
-    for path in qml_paths:
-        if os.path.exists(path):
-            print(f"Adding QML path: {path}")
-            engine.addImportPath(path)
-    
-    # Load the QML file - check multiple locations
-    qml_file_locations = [
-        os.path.join(os.path.dirname(__file__), "brightness_kirigami_qt6.qml"),  # Development location
-        "/usr/share/monitor-remote-control/brightness_kirigami_qt6.qml",  # Installed location
-    ]
-    
-    qml_file = None
-    for location in qml_file_locations:
-        if os.path.exists(location):
-            qml_file = location
-            break
-    
+    # Set import paths for Kirigami and locate the UI (cached across runs)
+    import_paths, qml_file = _resolve_qml_paths()
+    for path in import_paths:
+        logger.debug("Adding QML path: %s", path)
+        engine.addImportPath(path)
+
     if not qml_file:
-        print(f"QML file not found in any of these locations: {qml_file_locations}")
+        logger.error("QML file brightness_kirigami_qt6.qml not found")
         return 1
     
-    print(f"Loading QML file: {qml_file}")
-    engine.load(QUrl.fromLocalFile(qml_file))
+    logger.info("Loading QML file: %s", qml_file)
+    _ensure_qml_cache(qml_file)
+    # Absolute local-file URL so the QML disk cache keys consistently
+    # regardless of the working directory we were launched from
+    engine.load(QUrl.fromLocalFile(os.path.abspath(qml_file)))
     
     if not engine.rootObjects():
-        print("Failed to load QML file")
+        logger.error("Failed to load QML file")
         return 1
     
-    # Get the main window and ensure proper initialization
+    # Kirigami's ApplicationWindow shows itself on completion and the
+    # window size is declared in the QML root, so the initial layout
+    # pass happens exactly once
     root_objects = engine.rootObjects()
-    if root_objects:
-        main_window = root_objects[0]
-        print("Main window initialized successfully")
-        
-        # Force window to be visible and render properly
-        if hasattr(main_window, 'show'):
-            main_window.show()
-        if hasattr(main_window, 'raise_'):
-            main_window.raise_()
-        if hasattr(main_window, 'activateWindow'):
-            main_window.activateWindow()
-            
-        # Force immediate refresh to prevent blank/transparent state
-        if hasattr(main_window, 'update'):
-            main_window.update()
-        
-        # Ensure window is properly sized and positioned
-        if hasattr(main_window, 'setWidth') and hasattr(main_window, 'setHeight'):
-            main_window.setWidth(1000)
-            main_window.setHeight(700)
-    
-    print("Kirigami interface loaded successfully!")
-    
-    # Process events to ensure proper rendering before starting main loop
-    app.processEvents()
+    main_window = root_objects[0] if root_objects else None
+    if main_window is not None:
+        logger.debug("Main window initialized successfully")
     
+    logger.info("Kirigami interface loaded successfully!")
+
+    def prewarm_component_cache():
+        # Compile the generated per-monitor feature fragment once the
+        # event loop is idle, so the first expand of the monitor page
+        # hits the engine's warm component cache instead of compiling
+        # synchronously on the UI thread
+        controller = main_window.findChild(BrightnessController) if root_objects else None
+        if controller is None or not controller._current_monitor:
+            return
+        source = controller.buildFeaturesQml(controller._current_monitor)
+        if source:
+            component = QQmlComponent(engine)
+            component.setData(source.encode(), QUrl())
+            main.prewarmed_component = component
+
+    QTimer.singleShot(0, prewarm_component_cache)
+
     return app.exec()
 
 if __name__ == "__main__":
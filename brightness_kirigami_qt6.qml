@@ -7,7 +7,7 @@ import BrightnessControl 1.0
 Kirigami.ApplicationWindow {
     id: root
     title: "Monitor Remote Control"
-    width: 900
+    width: 1000
     height: 700
     minimumWidth: 800
     minimumHeight: 600
@@ -6,21 +6,20 @@ import subprocess
 
 def setup_kirigami_environment():
     """Setup environment variables for Kirigami"""
-    # Add Qt QML import paths
-    qml_paths = [
+    # Candidate Qt QML import paths
+    candidates = [
         "/usr/lib/qt/qml",
-        "/usr/lib/qt6/qml", 
+        "/usr/lib/qt6/qml",
         "/usr/lib/x86_64-linux-gnu/qt5/qml",
         "/usr/lib/x86_64-linux-gnu/qt6/qml"
     ]
-    
-    existing_path = os.environ.get('QML2_IMPORT_PATH', '')
-    if existing_path:
-        qml_paths.append(existing_path)
-    
-    # Set QML import path
-    os.environ['QML2_IMPORT_PATH'] = ':'.join(qml_paths)
-    
+    candidates += os.environ.get('QML2_IMPORT_PATH', '').split(os.pathsep)
+
+    # Keep only directories that exist (dropping them here saves Qt the
+    # probing at plugin-load time), deduped in order
+    paths = [p for p in dict.fromkeys(candidates) if p and os.path.isdir(p)]
+    os.environ['QML2_IMPORT_PATH'] = os.pathsep.join(paths)
+
     # Set Qt platform
     if 'QT_QPA_PLATFORM' not in os.environ:
         os.environ['QT_QPA_PLATFORM'] = 'xcb'
@@ -29,16 +28,16 @@ def try_kirigami_launch():
     """Try to launch the Kirigami interface"""
     try:
         setup_kirigami_environment()
-        
-        # Try to launch Kirigami version
+
+        # Replace the launcher process with the Kirigami GUI instead of
+        # forking a second interpreter; execv does not return on success
         kirigami_script = os.path.join(os.path.dirname(__file__), 'brightness_kirigami.py')
         if os.path.exists(kirigami_script):
             print("Attempting to launch Kirigami interface...")
-            subprocess.run([sys.executable, kirigami_script], check=True)
-            return True
-    except (subprocess.CalledProcessError, FileNotFoundError) as e:
+            os.execv(sys.executable, [sys.executable, kirigami_script])
+    except OSError as e:
         print(f"Kirigami launch failed: {e}")
-        return False
+    return False
 
 def fallback_tkinter_launch():
     """Fallback to the enhanced tkinter interface"""
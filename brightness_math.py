@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""Pure solar-position math shared by the GUI controllers and service."""
+
+import math
+from functools import lru_cache
+
+
+def _build_curve(knots, lo=-10.0, hi=90.0, steps=201):
+    """Sample a piecewise-linear curve into a flat tuple.
+
+    The knots fall on the half-degree sample grid, so interpolating the
+    table reproduces the original segments exactly.
+    """
+    step = (hi - lo) / (steps - 1)
+    samples = []
+    for i in range(steps):
+        x = lo + i * step
+        if x <= knots[0][0]:
+            samples.append(knots[0][1])
+            continue
+        if x >= knots[-1][0]:
+            samples.append(knots[-1][1])
+            continue
+        for (x0, y0), (x1, y1) in zip(knots, knots[1:]):
+            if x <= x1:
+                samples.append(y0 + (y1 - y0) * (x - x0) / (x1 - x0))
+                break
+    return tuple(samples)
+
+
+# Brightness factor (0..1 of the configured range) by solar elevation,
+# one table per mode: scaled follows sun height, simple is a plain
+# day/night ramp across civil twilight
+CURVE_SCALED = _build_curve([(-6, 0.0), (0, 0.3), (15, 0.7), (40, 1.0), (90, 1.0)])
+CURVE_SIMPLE = _build_curve([(-6, 0.0), (6, 1.0), (90, 1.0)])
+
+
+def brightness_factor(elevation, curve):
+    """Look up the brightness factor for an elevation in a sampled curve.
+
+    Branchless apart from the range clamp: index into the half-degree
+    table and lerp between the two neighbouring samples.
+    """
+    idx = (elevation + 10.0) * 2.0
+    if idx <= 0.0:
+        return curve[0]
+    last = len(curve) - 1
+    if idx >= last:
+        return curve[last]
+    i = int(idx)
+    frac = idx - i
+    return curve[i] + frac * (curve[i + 1] - curve[i])
+
+
+@lru_cache(maxsize=512)
+def solar_elevation(year, month, day, hour, minute, second, lat, lon,
+                    _sin=math.sin, _cos=math.cos, _asin=math.asin,
+                    _radians=math.radians, _degrees=math.degrees):
+    """Solar elevation in degrees for a UTC timestamp and location.
+
+    Takes the datetime broken into plain ints so the arguments form a
+    hashable lru_cache key at second granularity - repeat calls within
+    the same second (QML rebind storms) are a dict hit. The trig
+    functions are bound as defaults to skip module attribute lookups.
+    """
+    # Julian day calculation
+    a = (14 - month) // 12
+    y = year - a
+    m = month + 12 * a - 3
+    jdn = day + (153 * m + 2) // 5 + 365 * y + y // 4 - y // 100 + y // 400 - 32045
+
+    hour_decimal = hour + minute / 60.0 + second / 3600.0
+    jd = jdn + (hour_decimal - 12) / 24.0
+    n = jd - 2451545.0
+
+    L = (280.460 + 0.9856474 * n) % 360
+    g = _radians((357.528 + 0.9856003 * n) % 360)
+    lambda_sun = _radians(L + 1.915 * _sin(g) + 0.020 * _sin(2 * g))
+    declination = _asin(0.39795 * _cos(lambda_sun))
+
+    # Simplified equation of time
+    n_rad = _radians(n)
+    eot = 4 * lon + 229.18 * (0.000075 + 0.001868 * _cos(n_rad) -
+               0.032077 * _sin(n_rad) -
+               0.014615 * _cos(2 * n_rad) -
+               0.040849 * _sin(2 * n_rad))
+
+    tst = hour_decimal * 60 + eot
+    hour_angle = _radians(15 * (tst / 60 - 12))
+
+    lat_rad = _radians(lat)
+    return _degrees(_asin(_sin(declination) * _sin(lat_rad) +
+                          _cos(declination) * _cos(lat_rad) * _cos(hour_angle)))
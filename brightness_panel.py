@@ -3,30 +3,68 @@
 import tkinter as tk
 from tkinter import ttk
 import json
+import os
 import subprocess
-import threading
 import sys
 from pathlib import Path
 
+from settings_ui import SettingsFrame, screen_wh
+
+# Shared font descriptors for the panel labels
+_FONT_HEADER = ('Arial', 10, 'bold')
+_FONT_SMALL = ('Arial', 8)
+
+# orjson encodes/decodes several times faster than stdlib json; both
+# helpers deal in bytes so the callers don't care which one is active
+try:
+    import orjson
+    _dumps = lambda obj: orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    _loads = orjson.loads
+except ImportError:
+    _dumps = lambda obj: json.dumps(obj, indent=2).encode()
+    _loads = json.loads
+
+# Parsed config keyed by path, invalidated by mtime; refreshes after an
+# apply reuse the in-memory dict instead of re-reading the file
+_CONFIG_CACHE = {}
+
 class BrightnessPanelWidget:
     def __init__(self):
         self.config_path = "/home/user/Documents/auto-brightness/config.json"
         self.config = self.load_config()
-        
+
+        # Both live only while the settings window is open; None-checks
+        # below replace per-call hasattr probes
+        self.settings_window = None
+        self.status_label = None
+
         # Create a small floating panel widget
         self.create_panel_widget()
-        
+
     def load_config(self):
         try:
-            with open(self.config_path, 'r') as f:
-                return json.load(f)
+            mtime = os.stat(self.config_path).st_mtime_ns
+            hit = _CONFIG_CACHE.get(self.config_path)
+            if hit is not None and hit[0] == mtime:
+                return hit[1].copy()
+            with open(self.config_path, 'rb') as f:
+                parsed = _loads(f.read())
+            _CONFIG_CACHE[self.config_path] = (mtime, parsed)
+            # Copy so caller mutations don't poison the cached dict
+            return parsed.copy()
         except FileNotFoundError:
             return {"min_brightness": 0.3, "max_brightness": 1.0}
-    
+
     def save_config(self):
         try:
-            with open(self.config_path, 'w') as f:
-                json.dump(self.config, f, indent=2)
+            # Write-then-rename so the daemon reading the same file never
+            # sees a half-written config
+            tmp_path = self.config_path + '.tmp'
+            with open(tmp_path, 'wb') as f:
+                f.write(_dumps(self.config))
+            os.replace(tmp_path, self.config_path)
+            _CONFIG_CACHE[self.config_path] = (
+                os.stat(self.config_path).st_mtime_ns, self.config.copy())
         except Exception as e:
             print(f"Error saving config: {e}")
     
@@ -36,10 +74,8 @@ class BrightnessPanelWidget:
         self.root.geometry("200x120")
         
         # Position in top-right corner
-        self.root.geometry("+%d+%d" % (
-            self.root.winfo_screenwidth() - 220,
-            20
-        ))
+        screen_w, _ = screen_wh(self.root)
+        self.root.geometry("+%d+%d" % (screen_w - 220, 20))
         
         # Make it stay on top and look like a widget
         self.root.attributes('-topmost', True)
@@ -51,35 +87,33 @@ class BrightnessPanelWidget:
         self.setup_widget_ui()
         
     def setup_widget_ui(self):
+        # Single-column layout: everything packs straight into main_frame
+        # rather than through intermediate info/button frames
         main_frame = ttk.Frame(self.root, padding="10")
         main_frame.pack(fill=tk.BOTH, expand=True)
-        
+
         # Header with current brightness info
         current_night = int(self.config.get("min_brightness", 0.3) * 100)
         current_day = int(self.config.get("max_brightness", 1.0) * 100)
-        
-        header = ttk.Label(main_frame, text="🔆 Auto Brightness", 
-                          font=('Arial', 10, 'bold'))
+
+        header = ttk.Label(main_frame, text="🔆 Auto Brightness",
+                          font=_FONT_HEADER)
         header.pack(pady=(0, 10))
-        
-        # Quick info
-        info_frame = ttk.Frame(main_frame)
-        info_frame.pack(fill=tk.X, pady=(0, 10))
-        
-        ttk.Label(info_frame, text=f"🌙 Night: {current_night}%", 
-                 font=('Arial', 8)).pack()
-        ttk.Label(info_frame, text=f"☀️ Day: {current_day}%", 
-                 font=('Arial', 8)).pack()
-        
+
+        # Keep references so refresh_widget_info can retext them in place
+        self.night_info_label = ttk.Label(main_frame, text=f"🌙 Night: {current_night}%",
+                                          font=_FONT_SMALL)
+        self.night_info_label.pack()
+        self.day_info_label = ttk.Label(main_frame, text=f"☀️ Day: {current_day}%",
+                                        font=_FONT_SMALL)
+        self.day_info_label.pack(pady=(0, 10))
+
         # Buttons
-        btn_frame = ttk.Frame(main_frame)
-        btn_frame.pack(fill=tk.X)
-        
-        settings_btn = ttk.Button(btn_frame, text="⚙️ Settings", 
+        settings_btn = ttk.Button(main_frame, text="⚙️ Settings",
                                  command=self.open_full_settings, width=12)
         settings_btn.pack(side=tk.TOP, pady=2, fill=tk.X)
-        
-        restart_btn = ttk.Button(btn_frame, text="🔄 Restart", 
+
+        restart_btn = ttk.Button(main_frame, text="🔄 Restart",
                                 command=self.restart_service, width=12)
         restart_btn.pack(side=tk.TOP, pady=2, fill=tk.X)
         
@@ -92,7 +126,7 @@ class BrightnessPanelWidget:
         
     def open_full_settings(self):
         # Create full settings window
-        if hasattr(self, 'settings_window') and self.settings_window.winfo_exists():
+        if self.settings_window is not None and self.settings_window.winfo_exists():
             self.settings_window.lift()
             return
             
@@ -102,132 +136,83 @@ class BrightnessPanelWidget:
         self.settings_window.resizable(False, False)
         
         # Center the settings window
+        screen_w, screen_h = screen_wh(self.settings_window)
         self.settings_window.geometry("+%d+%d" % (
-            self.settings_window.winfo_screenwidth() // 2 - 190,
-            self.settings_window.winfo_screenheight() // 2 - 110
-        ))
+            screen_w // 2 - 190, screen_h // 2 - 110))
         
         self.setup_full_settings_ui()
     
     def setup_full_settings_ui(self):
-        main_frame = ttk.Frame(self.settings_window, padding="20")
-        main_frame.pack(fill=tk.BOTH, expand=True)
-        
-        # Title
-        title_label = ttk.Label(main_frame, text="🔆 Auto Brightness Settings", 
-                               font=('Arial', 14, 'bold'))
-        title_label.pack(pady=(0, 20))
-        
-        # Sliders frame
-        sliders_frame = ttk.Frame(main_frame)
-        sliders_frame.pack(fill=tk.X, pady=(0, 20))
-        
-        # Night brightness
-        night_frame = ttk.Frame(sliders_frame)
-        night_frame.pack(fill=tk.X, pady=5)
-        
-        ttk.Label(night_frame, text="🌙 Night Brightness:", 
-                 font=('Arial', 10)).pack(side=tk.LEFT)
-        
-        self.min_var = tk.DoubleVar(value=self.config.get("min_brightness", 0.3) * 100)
-        self.min_scale = ttk.Scale(night_frame, from_=10, to=80, 
-                                  variable=self.min_var, orient=tk.HORIZONTAL,
-                                  length=180, command=self.on_min_change)
-        self.min_scale.pack(side=tk.LEFT, padx=(10, 5))
-        
-        self.min_label = ttk.Label(night_frame, text=f"{int(self.min_var.get())}%",
-                                  font=('Arial', 10, 'bold'), width=4)
-        self.min_label.pack(side=tk.LEFT)
-        
-        # Day brightness
-        day_frame = ttk.Frame(sliders_frame)
-        day_frame.pack(fill=tk.X, pady=5)
-        
-        ttk.Label(day_frame, text="☀️ Day Brightness:", 
-                 font=('Arial', 10)).pack(side=tk.LEFT)
-        
-        self.max_var = tk.DoubleVar(value=self.config.get("max_brightness", 1.0) * 100)
-        self.max_scale = ttk.Scale(day_frame, from_=50, to=100,
-                                  variable=self.max_var, orient=tk.HORIZONTAL, 
-                                  length=180, command=self.on_max_change)
-        self.max_scale.pack(side=tk.LEFT, padx=(10, 5))
-        
-        self.max_label = ttk.Label(day_frame, text=f"{int(self.max_var.get())}%",
-                                  font=('Arial', 10, 'bold'), width=4)
-        self.max_label.pack(side=tk.LEFT)
-        
-        # Buttons
-        button_frame = ttk.Frame(main_frame)
-        button_frame.pack()
-        
-        ttk.Button(button_frame, text="✓ Apply Settings", 
-                  command=self.apply_settings).pack(side=tk.LEFT, padx=(0, 10))
-        
-        ttk.Button(button_frame, text="🔄 Restart Service", 
-                  command=self.restart_service).pack(side=tk.LEFT, padx=(0, 10))
-        
-        ttk.Button(button_frame, text="✕ Close", 
-                  command=self.settings_window.destroy).pack(side=tk.LEFT)
-        
-        # Status
-        self.status_label = ttk.Label(main_frame, text="Ready", 
-                                     foreground="green", font=('Arial', 9))
-        self.status_label.pack(pady=(15, 0))
-    
-    def on_min_change(self, value):
-        val = int(float(value))
-        self.min_label.config(text=f"{val}%")
-        if val >= self.max_var.get():
-            self.max_var.set(val + 10)
-            self.max_label.config(text=f"{int(self.max_var.get())}%")
-    
-    def on_max_change(self, value):
-        val = int(float(value))
-        self.max_label.config(text=f"{val}%")
-        if val <= self.min_var.get():
-            self.min_var.set(val - 10)
-            self.min_label.config(text=f"{int(self.min_var.get())}%")
+        ui = SettingsFrame(self.settings_window, self.config,
+                           self.apply_settings, self.restart_service,
+                           self.settings_window.destroy)
+        # Aliases for the apply/status paths
+        self.min_var = ui.min_var
+        self.max_var = ui.max_var
+        self.status_label = ui.status_label
     
     def apply_settings(self):
+        new_min = self.min_var.get() / 100
+        new_max = self.max_var.get() / 100
+        if (abs(new_min - self.config.get("min_brightness", 0.3)) < 1e-6
+                and abs(new_max - self.config.get("max_brightness", 1.0)) < 1e-6):
+            # Nothing moved - skip the disk write and the service restart
+            self.status_label.config(text="No changes", foreground="green")
+            return
+
         self.status_label.config(text="Applying settings...", foreground="orange")
         self.settings_window.update()
-        
+
         # Update config
-        self.config["min_brightness"] = self.min_var.get() / 100
-        self.config["max_brightness"] = self.max_var.get() / 100
+        self.config["min_brightness"] = new_min
+        self.config["max_brightness"] = new_max
         self.save_config()
         
         # Update main widget display
         self.refresh_widget_info()
-        
+
         # Restart service
-        threading.Thread(target=self._restart_service_thread, daemon=True).start()
-    
+        self._start_restart()
+
     def restart_service(self):
-        threading.Thread(target=self._restart_service_thread, daemon=True).start()
-    
-    def _restart_service_thread(self):
+        self._start_restart()
+
+    def _start_restart(self):
+        # Non-blocking restart polled from the Tk event loop: no worker
+        # thread to contend with Tk's interpreter lock and no Tk calls
+        # from off the main thread
         try:
-            subprocess.run(['systemctl', '--user', 'restart', 'auto-brightness.service'], 
-                         check=True, capture_output=True)
-            
-            if hasattr(self, 'status_label'):
-                self.settings_window.after(0, lambda: self.status_label.config(
-                    text="✓ Settings applied successfully!", foreground="green"))
-                self.settings_window.after(3000, lambda: self.status_label.config(
-                    text="Ready", foreground="green"))
-                
-        except subprocess.CalledProcessError:
-            if hasattr(self, 'status_label'):
-                self.settings_window.after(0, lambda: self.status_label.config(
-                    text="✗ Error restarting service", foreground="red"))
+            self._restart_proc = subprocess.Popen(
+                ['systemctl', '--user', 'restart', 'auto-brightness.service'],
+                stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        except OSError:
+            self._set_status("✗ Error restarting service", "red")
+            return
+        self._poll_restart()
+
+    def _poll_restart(self):
+        rc = self._restart_proc.poll()
+        if rc is None:
+            self.root.after(100, self._poll_restart)
+        elif rc == 0:
+            self._set_status("✓ Settings applied successfully!", "green")
+            self.root.after(3000, lambda: self._set_status("Ready", "green"))
+        else:
+            self._set_status("✗ Error restarting service", "red")
+
+    def _set_status(self, text, color):
+        # The status label only exists while the settings window is open
+        if self.status_label is not None and self.settings_window.winfo_exists():
+            self.status_label.config(text=text, foreground=color)
     
     def refresh_widget_info(self):
-        # Reload config and update widget display
+        # Reload config and retext the two info labels in place - no need
+        # to tear down and rebuild the whole panel for that
         self.config = self.load_config()
-        self.root.destroy()
-        self.create_panel_widget()
-        self.setup_widget_ui()
+        night = int(self.config.get("min_brightness", 0.3) * 100)
+        day = int(self.config.get("max_brightness", 1.0) * 100)
+        self.night_info_label.config(text=f"🌙 Night: {night}%")
+        self.day_info_label.config(text=f"☀️ Day: {day}%")
         
     def run(self):
         self.root.mainloop()
@@ -3,80 +3,152 @@
 import tkinter as tk
 from tkinter import ttk
 import json
+import os
 import subprocess
-import threading
 import sys
 from pathlib import Path
+from functools import lru_cache
+
+from settings_ui import SettingsFrame, screen_wh
+
+# pystray/PIL are imported on demand: PIL alone registers every image
+# codec at import (tens of ms and a few hundred KB), wasted when the
+# tray is unavailable and only the settings window runs
+pystray = None
+Image = None
+ImageDraw = None
+
+
+def _load_tray():
+    """Import the tray dependencies, once; returns availability"""
+    global pystray, Image, ImageDraw
+    if pystray is not None:
+        return True
+    try:
+        import pystray as _pystray
+        from PIL import Image as _Image, ImageDraw as _ImageDraw
+    except ImportError:
+        return False
+    pystray, Image, ImageDraw = _pystray, _Image, _ImageDraw
+    return True
+
+
+@lru_cache(maxsize=1)
+def _draw_icon():
+    """Rasterize the sun icon once per process"""
+    image = Image.new('RGB', (64, 64), color='black')
+    draw = ImageDraw.Draw(image)
+
+    # Draw sun-like icon
+    draw.ellipse([16, 16, 48, 48], fill='yellow', outline='orange', width=2)
+
+    # Draw rays
+    rays = [(32, 4, 32, 12), (32, 52, 32, 60), (4, 32, 12, 32),
+            (52, 32, 60, 32), (12, 12, 18, 18), (46, 46, 52, 52),
+            (46, 18, 52, 12), (18, 46, 12, 52)]
+    for ray in rays:
+        draw.line(ray, fill='orange', width=2)
+
+    return image
+
+
+def _tray_icon(cache_path):
+    """Load the icon from the PNG cache beside the config; draw on miss.
+
+    Later launches skip the PIL drawing calls entirely - the PNG sits in
+    the OS page cache after the first start.
+    """
+    try:
+        return Image.open(cache_path)
+    except (FileNotFoundError, OSError):
+        pass
+    image = _draw_icon()
+    try:
+        image.save(cache_path, 'PNG', optimize=True)
+    except OSError:
+        pass
+    return image
+
+# orjson encodes/decodes several times faster than stdlib json; both
+# helpers deal in bytes so the callers don't care which one is active
 try:
-    import pystray
-    from PIL import Image, ImageDraw
-    TRAY_AVAILABLE = True
+    import orjson
+    _dumps = lambda obj: orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    _loads = orjson.loads
 except ImportError:
-    TRAY_AVAILABLE = False
+    _dumps = lambda obj: json.dumps(obj, indent=2).encode()
+    _loads = json.loads
+
+# Parsed config keyed by path, invalidated by mtime; refreshes after an
+# apply reuse the in-memory dict instead of re-reading the file
+_CONFIG_CACHE = {}
 
 class BrightnessTray:
     def __init__(self):
         self.config_path = "/home/user/Documents/auto-brightness/config.json"
         self.config = self.load_config()
         self.settings_window = None
-        
-        if TRAY_AVAILABLE:
+        # Lives only while a settings window is open; None-checks below
+        # replace per-call hasattr probes
+        self.status_label = None
+
+        self._tray_ok = _load_tray()
+        if self._tray_ok:
             self.setup_tray()
         else:
             print("System tray not available. Install: pip install pystray pillow")
             self.create_settings_window()
-            
+
     def load_config(self):
         try:
-            with open(self.config_path, 'r') as f:
-                return json.load(f)
+            mtime = os.stat(self.config_path).st_mtime_ns
+            hit = _CONFIG_CACHE.get(self.config_path)
+            if hit is not None and hit[0] == mtime:
+                return hit[1].copy()
+            with open(self.config_path, 'rb') as f:
+                parsed = _loads(f.read())
+            _CONFIG_CACHE[self.config_path] = (mtime, parsed)
+            # Copy so caller mutations don't poison the cached dict
+            return parsed.copy()
         except FileNotFoundError:
             return {"min_brightness": 0.3, "max_brightness": 1.0}
-    
+
     def save_config(self):
         try:
-            with open(self.config_path, 'w') as f:
-                json.dump(self.config, f, indent=2)
+            # Write-then-rename so the daemon reading the same file never
+            # sees a half-written config
+            tmp_path = self.config_path + '.tmp'
+            with open(tmp_path, 'wb') as f:
+                f.write(_dumps(self.config))
+            os.replace(tmp_path, self.config_path)
+            _CONFIG_CACHE[self.config_path] = (
+                os.stat(self.config_path).st_mtime_ns, self.config.copy())
         except Exception as e:
             print(f"Error saving config: {e}")
     
-    def create_tray_icon(self):
-        # Create a simple brightness icon
-        image = Image.new('RGB', (64, 64), color='black')
-        draw = ImageDraw.Draw(image)
-        
-        # Draw sun-like icon
-        draw.ellipse([16, 16, 48, 48], fill='yellow', outline='orange', width=2)
-        
-        # Draw rays
-        rays = [(32, 4, 32, 12), (32, 52, 32, 60), (4, 32, 12, 32), 
-                (52, 32, 60, 32), (12, 12, 18, 18), (46, 46, 52, 52),
-                (46, 18, 52, 12), (18, 46, 12, 52)]
-        for ray in rays:
-            draw.line(ray, fill='orange', width=2)
-            
-        return image
-    
-    def setup_tray(self):
-        icon_image = self.create_tray_icon()
-        
-        menu_items = [
+    def _menu_values(self):
+        """(night, day) percentages currently shown in the menu"""
+        return (int(self.config.get('min_brightness', 0.3) * 100),
+                int(self.config.get('max_brightness', 1.0) * 100))
+
+    def _build_menu(self, night, day):
+        return pystray.Menu(
             pystray.MenuItem("Settings", self.show_settings),
             pystray.MenuItem("Restart Service", self.restart_service),
             pystray.Menu.SEPARATOR,
-            pystray.MenuItem(f"Night: {int(self.config.get('min_brightness', 0.3) * 100)}%", 
-                           None, enabled=False),
-            pystray.MenuItem(f"Day: {int(self.config.get('max_brightness', 1.0) * 100)}%", 
-                           None, enabled=False),
+            pystray.MenuItem(f"Night: {night}%", None, enabled=False),
+            pystray.MenuItem(f"Day: {day}%", None, enabled=False),
             pystray.Menu.SEPARATOR,
             pystray.MenuItem("Quit", self.quit_app)
-        ]
-        
+        )
+
+    def setup_tray(self):
+        self._last_menu_values = self._menu_values()
         self.tray_icon = pystray.Icon(
             "auto_brightness",
-            icon_image,
+            _tray_icon(Path(self.config_path).with_name('tray_icon.png')),
             "Auto Brightness Control",
-            pystray.Menu(*menu_items)
+            self._build_menu(*self._last_menu_values)
         )
     
     def show_settings(self, icon=None, item=None):
@@ -93,158 +165,116 @@ class BrightnessTray:
         self.settings_window.resizable(False, False)
         
         # Center the window
+        screen_w, screen_h = screen_wh(self.settings_window)
         self.settings_window.geometry("+%d+%d" % (
-            self.settings_window.winfo_screenwidth() // 2 - 190,
-            self.settings_window.winfo_screenheight() // 2 - 110
-        ))
+            screen_w // 2 - 190, screen_h // 2 - 110))
         
         self.setup_settings_ui()
         
-        if not TRAY_AVAILABLE:
+        if not self._tray_ok:
             self.settings_window.mainloop()
     
     def setup_settings_ui(self):
-        main_frame = ttk.Frame(self.settings_window, padding="20")
-        main_frame.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
-        
-        # Title
-        title_label = ttk.Label(main_frame, text="🔆 Auto Brightness Settings", 
-                               font=('Arial', 14, 'bold'))
-        title_label.grid(row=0, column=0, columnspan=3, pady=(0, 20))
-        
-        # Night brightness slider
-        ttk.Label(main_frame, text="🌙 Night Brightness:", 
-                 font=('Arial', 10)).grid(row=1, column=0, sticky=tk.W, pady=5)
-        
-        self.min_var = tk.DoubleVar(value=self.config.get("min_brightness", 0.3) * 100)
-        self.min_scale = ttk.Scale(main_frame, from_=10, to=80, 
-                                  variable=self.min_var, orient=tk.HORIZONTAL,
-                                  length=180, command=self.on_min_change)
-        self.min_scale.grid(row=1, column=1, padx=(10, 5), pady=5)
-        
-        self.min_label = ttk.Label(main_frame, text=f"{int(self.min_var.get())}%",
-                                  font=('Arial', 10, 'bold'))
-        self.min_label.grid(row=1, column=2, pady=5)
-        
-        # Day brightness slider  
-        ttk.Label(main_frame, text="☀️ Day Brightness:", 
-                 font=('Arial', 10)).grid(row=2, column=0, sticky=tk.W, pady=5)
-        
-        self.max_var = tk.DoubleVar(value=self.config.get("max_brightness", 1.0) * 100)
-        self.max_scale = ttk.Scale(main_frame, from_=50, to=100,
-                                  variable=self.max_var, orient=tk.HORIZONTAL, 
-                                  length=180, command=self.on_max_change)
-        self.max_scale.grid(row=2, column=1, padx=(10, 5), pady=5)
-        
-        self.max_label = ttk.Label(main_frame, text=f"{int(self.max_var.get())}%",
-                                  font=('Arial', 10, 'bold'))
-        self.max_label.grid(row=2, column=2, pady=5)
-        
-        # Buttons
-        button_frame = ttk.Frame(main_frame)
-        button_frame.grid(row=3, column=0, columnspan=3, pady=(20, 0))
-        
-        apply_btn = ttk.Button(button_frame, text="✓ Apply Settings", 
-                              command=self.apply_settings)
-        apply_btn.pack(side=tk.LEFT, padx=(0, 10))
-        
-        restart_btn = ttk.Button(button_frame, text="🔄 Restart Service", 
-                                command=self.restart_service)
-        restart_btn.pack(side=tk.LEFT, padx=(0, 10))
-        
-        close_btn = ttk.Button(button_frame, text="✕ Close", 
-                              command=self.close_settings)
-        close_btn.pack(side=tk.LEFT)
-        
-        # Status label
-        self.status_label = ttk.Label(main_frame, text="Ready", 
-                                     foreground="green", font=('Arial', 9))
-        self.status_label.grid(row=4, column=0, columnspan=3, pady=(15, 0))
-        
-    def on_min_change(self, value):
-        val = int(float(value))
-        self.min_label.config(text=f"{val}%")
-        if val >= self.max_var.get():
-            self.max_var.set(val + 10)
-            self.max_label.config(text=f"{int(self.max_var.get())}%")
-    
-    def on_max_change(self, value):
-        val = int(float(value))
-        self.max_label.config(text=f"{val}%")
-        if val <= self.min_var.get():
-            self.min_var.set(val - 10)
-            self.min_label.config(text=f"{int(self.min_var.get())}%")
+        ui = SettingsFrame(self.settings_window, self.config,
+                           self.apply_settings, self.restart_service,
+                           self.close_settings)
+        # Aliases for the apply/status paths
+        self.min_var = ui.min_var
+        self.max_var = ui.max_var
+        self.status_label = ui.status_label
     
     def apply_settings(self):
+        new_min = self.min_var.get() / 100
+        new_max = self.max_var.get() / 100
+        if (abs(new_min - self.config.get("min_brightness", 0.3)) < 1e-6
+                and abs(new_max - self.config.get("max_brightness", 1.0)) < 1e-6):
+            # Nothing moved - skip the disk write and the service restart
+            self.status_label.config(text="No changes", foreground="green")
+            return
+
         self.status_label.config(text="Applying settings...", foreground="orange")
         if self.settings_window:
             self.settings_window.update()
-        
+
         # Update config
-        self.config["min_brightness"] = self.min_var.get() / 100
-        self.config["max_brightness"] = self.max_var.get() / 100
+        self.config["min_brightness"] = new_min
+        self.config["max_brightness"] = new_max
         self.save_config()
         
         # Update tray menu if available
-        if TRAY_AVAILABLE:
+        if self._tray_ok:
             self.update_tray_menu()
         
         # Restart service
-        threading.Thread(target=self._restart_service_thread, daemon=True).start()
-    
+        self._start_restart()
+
     def restart_service(self, icon=None, item=None):
-        if hasattr(self, 'status_label'):
+        if self.status_label is not None and self._window_alive():
             self.status_label.config(text="Restarting service...", foreground="orange")
-            if self.settings_window:
-                self.settings_window.update()
-        threading.Thread(target=self._restart_service_thread, daemon=True).start()
-    
-    def _restart_service_thread(self):
+            self.settings_window.update()
+        self._start_restart()
+
+    def _start_restart(self):
+        # Non-blocking restart polled from the Tk event loop: no worker
+        # thread to contend with Tk's interpreter lock and no Tk calls
+        # from off the main thread
         try:
-            subprocess.run(['systemctl', '--user', 'restart', 'auto-brightness.service'], 
-                         check=True, capture_output=True)
-            
-            if hasattr(self, 'status_label') and self.settings_window:
-                self.settings_window.after(0, lambda: self.status_label.config(
-                    text="✓ Settings applied successfully!", foreground="green"))
-                self.settings_window.after(3000, lambda: self.status_label.config(
-                    text="Ready", foreground="green"))
-                
-        except subprocess.CalledProcessError:
-            if hasattr(self, 'status_label') and self.settings_window:
-                self.settings_window.after(0, lambda: self.status_label.config(
-                    text="✗ Error restarting service", foreground="red"))
+            self._restart_proc = subprocess.Popen(
+                ['systemctl', '--user', 'restart', 'auto-brightness.service'],
+                stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        except OSError:
+            self._set_status("✗ Error restarting service", "red")
+            return
+        # Without a settings window there is no status to report and no
+        # Tk loop to poll from; systemctl runs to completion on its own
+        if self._window_alive():
+            self._poll_restart()
+
+    def _poll_restart(self):
+        if not self._window_alive():
+            return
+        rc = self._restart_proc.poll()
+        if rc is None:
+            self.settings_window.after(100, self._poll_restart)
+        elif rc == 0:
+            self._set_status("✓ Settings applied successfully!", "green")
+            self.settings_window.after(3000, lambda: self._set_status("Ready", "green"))
+        else:
+            self._set_status("✗ Error restarting service", "red")
+
+    def _window_alive(self):
+        return self.settings_window is not None and self.settings_window.winfo_exists()
+
+    def _set_status(self, text, color):
+        if self.status_label is not None and self._window_alive():
+            self.status_label.config(text=text, foreground=color)
     
     def update_tray_menu(self):
-        if TRAY_AVAILABLE:
-            # Update the menu items with new values
-            menu_items = [
-                pystray.MenuItem("Settings", self.show_settings),
-                pystray.MenuItem("Restart Service", self.restart_service),
-                pystray.Menu.SEPARATOR,
-                pystray.MenuItem(f"Night: {int(self.config.get('min_brightness', 0.3) * 100)}%", 
-                               None, enabled=False),
-                pystray.MenuItem(f"Day: {int(self.config.get('max_brightness', 1.0) * 100)}%", 
-                               None, enabled=False),
-                pystray.Menu.SEPARATOR,
-                pystray.MenuItem("Quit", self.quit_app)
-            ]
-            self.tray_icon.menu = pystray.Menu(*menu_items)
+        if not self._tray_ok:
+            return
+        values = self._menu_values()
+        if values == self._last_menu_values:
+            # Nothing the menu shows has changed - skip the rebuild
+            return
+        self._last_menu_values = values
+        self.tray_icon.menu = self._build_menu(*values)
+        self.tray_icon.update_menu()
     
     def close_settings(self):
         if self.settings_window:
             self.settings_window.destroy()
             self.settings_window = None
+            self.status_label = None
     
     def quit_app(self, icon=None, item=None):
-        if TRAY_AVAILABLE:
+        if self._tray_ok:
             self.tray_icon.stop()
         if self.settings_window:
             self.settings_window.destroy()
         sys.exit()
     
     def run(self):
-        if TRAY_AVAILABLE:
+        if self._tray_ok:
             # Show settings window initially
             self.show_settings()
             self.tray_icon.run()
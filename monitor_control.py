@@ -1,11 +1,31 @@
 #!/usr/bin/env python3
 
+import errno
 import subprocess
 import json
 import logging
+import threading
 import re
+import time
 from typing import Dict, List, Optional, Tuple, Any
 
+# Compiled once - getvcp output parsing sits on the slider hot path
+_VCP_CURRENT_RE = re.compile(r'current value\s*=\s*(\d+)', re.IGNORECASE)
+
+# In-process D-Bus when jeepney is installed: one persistent session-bus
+# socket instead of a qdbus fork/exec (plus Qt startup) per call. Pure
+# optional - everything falls back to qdbus subprocesses without it.
+try:
+    from jeepney import DBusAddress, MessageType, new_method_call
+    from jeepney.io.blocking import open_dbus_connection
+except ImportError:
+    open_dbus_connection = None
+
+# Distinguishes "the bus answered with a D-Bus error" (the call itself
+# failed; retrying via qdbus won't help) from "no in-process transport"
+# (None - fall back to the qdbus subprocess)
+_DBUS_ERROR = object()
+
 
 class KDEScreenBrightness:
     """KDE PowerDevil ScreenBrightness DBus interface for monitor control.
@@ -21,6 +41,14 @@ class KDEScreenBrightness:
 
     def __init__(self):
         self.monitors = {}
+        # Lazily opened session-bus socket; stays None (qdbus fallback)
+        # when jeepney is missing or the bus cannot be reached. jeepney's
+        # blocking connection is not thread-safe and both the GUI thread
+        # and pool workers land here, so every round-trip holds the lock
+        # (reentrant: _connection locks too and is also called bare)
+        self._bus = None
+        self._bus_failed = open_dbus_connection is None
+        self._bus_lock = threading.RLock()
         self.setup_logging()
 
     def setup_logging(self):
@@ -30,6 +58,47 @@ class KDEScreenBrightness:
         )
         self.logger = logging.getLogger('KDEScreenBrightness')
 
+    def _connection(self):
+        """Persistent session-bus connection, or None to use qdbus"""
+        with self._bus_lock:
+            if self._bus is None and not self._bus_failed:
+                try:
+                    self._bus = open_dbus_connection(bus='SESSION')
+                except Exception as e:
+                    self.logger.debug(f"In-process D-Bus unavailable, using qdbus: {e}")
+                    self._bus_failed = True
+            return self._bus
+
+    def _dbus_reply(self, path: str, interface: str, method: str,
+                    signature: Optional[str] = None, args: tuple = ()):
+        """One in-process D-Bus round-trip.
+
+        Returns the reply body tuple on success, _DBUS_ERROR when the bus
+        answered with an error reply, and None when there is no working
+        in-process transport (caller should fall back to qdbus).
+        """
+        addr = DBusAddress(path, bus_name=self.DBUS_SERVICE, interface=interface)
+        with self._bus_lock:
+            conn = self._connection()
+            if conn is None:
+                return None
+            try:
+                reply = conn.send_and_get_reply(
+                    new_method_call(addr, method, signature, args), timeout=5)
+            except Exception as e:
+                # Transport problem (dead socket, timeout): drop the
+                # connection so the next call reopens or falls back to qdbus
+                self.logger.debug(f"D-Bus transport failed on {interface}.{method}: {e}")
+                try:
+                    conn.close()
+                except Exception:
+                    pass
+                self._bus = None
+                return None
+        if reply.header.message_type != MessageType.method_return:
+            return _DBUS_ERROR
+        return reply.body
+
     def _call_dbus(self, display_index: int, method: str, *args) -> Optional[str]:
         """Call a DBus method on a display"""
         path = f"{self.DBUS_PATH_PREFIX}{display_index}"
@@ -43,9 +112,17 @@ class KDEScreenBrightness:
             self.logger.error(f"DBus call failed: {e}")
             return None
 
-    def _get_property(self, display_index: int, property_name: str) -> Optional[str]:
-        """Get a DBus property from a display"""
+    def _get_property(self, display_index: int, property_name: str):
+        """Get a DBus property from a display (typed in-process, str via qdbus)"""
         path = f"{self.DBUS_PATH_PREFIX}{display_index}"
+        body = self._dbus_reply(path, 'org.freedesktop.DBus.Properties', 'Get',
+                                'ss', (self.DBUS_INTERFACE, property_name))
+        if body is _DBUS_ERROR:
+            return None
+        if body is not None:
+            # Properties.Get wraps the value in a (signature, value) variant
+            return body[0][1]
+
         cmd = ['qdbus', self.DBUS_SERVICE, path,
                'org.freedesktop.DBus.Properties.Get',
                self.DBUS_INTERFACE, property_name]
@@ -58,8 +135,32 @@ class KDEScreenBrightness:
             self.logger.error(f"DBus property get failed: {e}")
             return None
 
+    def _get_all_properties(self, display_index: int) -> Dict[str, Any]:
+        """All Display interface properties in one GetAll round-trip.
+
+        Falls back to per-property Get calls when the in-process bus is
+        unavailable - qdbus output for GetAll is not worth parsing.
+        """
+        path = f"{self.DBUS_PATH_PREFIX}{display_index}"
+        body = self._dbus_reply(path, 'org.freedesktop.DBus.Properties',
+                                'GetAll', 's', (self.DBUS_INTERFACE,))
+        if body is _DBUS_ERROR:
+            return {}
+        if body is not None:
+            # GetAll returns {name: (signature, value)} variants
+            return {name: variant[1] for name, variant in body[0].items()}
+
+        props = {}
+        for name in ('Label', 'MaxBrightness', 'Brightness'):
+            value = self._get_property(display_index, name)
+            if value is not None:
+                props[name] = value
+        return props
+
     def is_available(self) -> bool:
         """Check if KDE ScreenBrightness interface is available"""
+        if self._connection() is not None:
+            return bool(self._get_display_names())
         try:
             result = subprocess.run(
                 ['qdbus', self.DBUS_SERVICE, self.DBUS_PATH, 'org.kde.ScreenBrightness.DisplaysDBusNames'],
@@ -71,6 +172,15 @@ class KDEScreenBrightness:
 
     def _get_display_names(self) -> list:
         """Get list of display names from KDE ScreenBrightness"""
+        body = self._dbus_reply(self.DBUS_PATH, 'org.freedesktop.DBus.Properties',
+                                'Get', 'ss',
+                                ('org.kde.ScreenBrightness', 'DisplaysDBusNames'))
+        if body is _DBUS_ERROR:
+            # Bus reachable but the service isn't there; qdbus would agree
+            return []
+        if body is not None:
+            return list(body[0][1])
+
         try:
             result = subprocess.run(
                 ['qdbus', self.DBUS_SERVICE, self.DBUS_PATH, 'org.kde.ScreenBrightness.DisplaysDBusNames'],
@@ -96,12 +206,14 @@ class KDEScreenBrightness:
             except ValueError:
                 continue
 
-            label = self._get_property(idx, "Label")
+            # One GetAll round-trip instead of three Properties.Get calls
+            props = self._get_all_properties(idx)
+            label = props.get('Label')
             if label is None:
                 continue
 
-            max_brightness = self._get_property(idx, "MaxBrightness")
-            brightness = self._get_property(idx, "Brightness")
+            max_brightness = props.get('MaxBrightness')
+            brightness = props.get('Brightness')
 
             monitor_id = f"kde_{idx}"
             monitors[monitor_id] = {
@@ -152,6 +264,16 @@ class KDEScreenBrightness:
         # Call SetBrightness(int brightness, uint flags)
         # flags=0 means normal brightness change
         path = f"{self.DBUS_PATH_PREFIX}{kde_index}"
+        body = self._dbus_reply(path, self.DBUS_INTERFACE, 'SetBrightness',
+                                'iu', (brightness_value, 0))
+        if body is _DBUS_ERROR:
+            # The call reached PowerDevil and was rejected
+            self.logger.error(f"Failed to set brightness on {monitor_id}")
+            return False
+        if body is not None:
+            self.logger.info(f"Set brightness to {brightness_percent}% on {monitor_id}")
+            return True
+
         cmd = ['qdbus', self.DBUS_SERVICE, path,
                f'{self.DBUS_INTERFACE}.SetBrightness',
                str(brightness_value), '0']
@@ -347,7 +469,12 @@ class DDCIMonitorControl:
         self.monitors = {}
         self.vcp_features = {}
         self.setup_logging()
-        
+        # In-process DDC/CI reader - avoids forking a full ddcutil process
+        # (detect phase + mandated sleeps, hundreds of ms) per VCP read.
+        # Buses where the raw protocol fails fall back to ddcutil permanently.
+        self._raw_reader = RawDDCIMonitorControl()
+        self._raw_unsupported_buses = set()
+
     def setup_logging(self):
         """Setup logging for DDC/CI operations"""
         logging.basicConfig(
@@ -401,11 +528,34 @@ class DDCIMonitorControl:
                         else:
                             monitors[current_monitor]['label'] = model_raw
             
-            # Get capabilities for each monitor
+            # Probe capabilities for all monitors concurrently: each
+            # 'ddcutil capabilities' run can take seconds of I2C traffic,
+            # so launch every Popen before the first communicate() and
+            # pay max-of-latencies instead of sum-of-latencies
+            procs = {}
             for monitor_id, monitor_info in monitors.items():
                 if monitor_info['i2c_bus']:
-                    capabilities = self.get_monitor_capabilities(monitor_info['i2c_bus'])
-                    monitors[monitor_id]['capabilities'] = capabilities
+                    try:
+                        procs[monitor_id] = subprocess.Popen(
+                            ['ddcutil', '--bus', monitor_info['i2c_bus'], 'capabilities'],
+                            stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
+                    except OSError as e:
+                        self.logger.error(
+                            f"Failed to probe capabilities for bus {monitor_info['i2c_bus']}: {e}")
+
+            for monitor_id, proc in procs.items():
+                bus = monitors[monitor_id]['i2c_bus']
+                try:
+                    stdout, _ = proc.communicate(timeout=10)
+                except subprocess.TimeoutExpired:
+                    proc.kill()
+                    proc.communicate()
+                    self.logger.error(f"Capabilities probe timed out on bus {bus}")
+                    continue
+                if proc.returncode != 0:
+                    self.logger.error(f"Failed to get capabilities for bus {bus}")
+                    continue
+                monitors[monitor_id]['capabilities'] = self._parse_capabilities(stdout)
             
             self.monitors = monitors
             return monitors
@@ -421,54 +571,76 @@ class DDCIMonitorControl:
                 ['ddcutil', '--bus', bus, 'capabilities'],
                 capture_output=True, text=True, check=True
             )
-            
-            capabilities = {
-                'model': 'Unknown',
-                'mccs_version': 'Unknown',
-                'features': {}
-            }
-            
-            current_feature = None
-            
-            for line in result.stdout.split('\n'):
-                line = line.strip()
-                
-                # Parse model
-                if line.startswith('Model:'):
-                    capabilities['model'] = line.split(':', 1)[1].strip()
-                
-                # Parse MCCS version
-                elif line.startswith('MCCS version:'):
-                    capabilities['mccs_version'] = line.split(':', 1)[1].strip()
-                
-                # Parse VCP features
-                elif line.startswith('Feature:'):
-                    feature_match = re.search(r'Feature:\s*([0-9A-Fa-f]+)\s*\((.+?)\)', line)
-                    if feature_match:
-                        feature_code = feature_match.group(1).upper()
-                        feature_name = feature_match.group(2)
-                        current_feature = feature_code
-                        capabilities['features'][feature_code] = {
-                            'name': feature_name,
-                            'values': {}
-                        }
-                
-                # Parse feature values
-                elif current_feature and line and 'Values:' not in line:
-                    value_match = re.search(r'([0-9A-Fa-f]+):\s*(.+)', line)
-                    if value_match:
-                        value_code = value_match.group(1).upper()
-                        value_name = value_match.group(2)
-                        capabilities['features'][current_feature]['values'][value_code] = value_name
-            
-            return capabilities
-            
+            return self._parse_capabilities(result.stdout)
+
         except subprocess.CalledProcessError as e:
             self.logger.error(f"Failed to get capabilities for bus {bus}: {e}")
             return {}
-    
+
+    @staticmethod
+    def _parse_capabilities(output: str) -> Dict[str, Any]:
+        """Parse 'ddcutil capabilities' output into a capabilities dict"""
+        capabilities = {
+            'model': 'Unknown',
+            'mccs_version': 'Unknown',
+            'features': {}
+        }
+
+        current_feature = None
+
+        for line in output.split('\n'):
+            line = line.strip()
+
+            # Parse model
+            if line.startswith('Model:'):
+                capabilities['model'] = line.split(':', 1)[1].strip()
+
+            # Parse MCCS version
+            elif line.startswith('MCCS version:'):
+                capabilities['mccs_version'] = line.split(':', 1)[1].strip()
+
+            # Parse VCP features
+            elif line.startswith('Feature:'):
+                feature_match = re.search(r'Feature:\s*([0-9A-Fa-f]+)\s*\((.+?)\)', line)
+                if feature_match:
+                    feature_code = feature_match.group(1).upper()
+                    feature_name = feature_match.group(2)
+                    current_feature = feature_code
+                    capabilities['features'][feature_code] = {
+                        'name': feature_name,
+                        'values': {}
+                    }
+
+            # Parse feature values
+            elif current_feature and line and 'Values:' not in line:
+                value_match = re.search(r'([0-9A-Fa-f]+):\s*(.+)', line)
+                if value_match:
+                    value_code = value_match.group(1).upper()
+                    value_name = value_match.group(2)
+                    capabilities['features'][current_feature]['values'][value_code] = value_name
+
+        return capabilities
+
     def get_vcp_value(self, bus: str, feature_code: str) -> Optional[int]:
         """Get current value of a VCP feature"""
+        # Fast path: talk DDC/CI over i2c-dev directly instead of spawning
+        # ddcutil. A read takes single-digit ms instead of hundreds.
+        if bus not in self._raw_unsupported_buses:
+            try:
+                result = self._raw_reader._vcp_get(int(bus), int(feature_code, 16))
+                if result is not None:
+                    return result[0]
+                # A failed read is usually transient (DPMS wake, bus busy
+                # with another transaction); fall back to ddcutil for this
+                # call but keep trying raw next time
+            except ValueError:
+                self._raw_unsupported_buses.add(bus)
+            except OSError as e:
+                # Only demote the bus permanently when the device itself is
+                # unusable; anything else can succeed on the next attempt
+                if e.errno in (errno.ENOENT, errno.EACCES, errno.ENODEV):
+                    self._raw_unsupported_buses.add(bus)
+
         try:
             result = subprocess.run(
                 ['ddcutil', '--bus', bus, 'getvcp', feature_code],
@@ -476,13 +648,8 @@ class DDCIMonitorControl:
             )
             
             # Parse the output to extract current value
-            for line in result.stdout.split('\n'):
-                if 'current value' in line.lower():
-                    value_match = re.search(r'current value\s*=\s*(\d+)', line)
-                    if value_match:
-                        return int(value_match.group(1))
-            
-            return None
+            match = _VCP_CURRENT_RE.search(result.stdout)
+            return int(match.group(1)) if match else None
             
         except subprocess.CalledProcessError as e:
             self.logger.error(f"Failed to get VCP value for feature {feature_code} on bus {bus}: {e}")
@@ -492,7 +659,8 @@ class DDCIMonitorControl:
         """Set value of a VCP feature"""
         try:
             subprocess.run(
-                ['ddcutil', '--bus', bus, 'setvcp', feature_code, str(value)],
+                ['ddcutil', '--bus', bus, '--skip-ddc-checks', '--noverify',
+                 '--sleep-multiplier', '.1', 'setvcp', feature_code, str(value)],
                 capture_output=True, text=True, check=True
             )
             self.logger.info(f"Set VCP feature {feature_code} to {value} on bus {bus}")
@@ -616,6 +784,10 @@ class HybridMonitorControl:
         self.ddc = DDCIMonitorControl()
         self.raw_ddc = RawDDCIMonitorControl()
         self.monitors = {}
+        # Detection involves multi-second I2C probing; remember the last
+        # result so back-to-back callers don't re-scan the buses
+        self._detect_cache_time = 0.0
+        self._detect_cache_ttl = 30.0
         self.setup_logging()
 
     def setup_logging(self):
@@ -625,8 +797,16 @@ class HybridMonitorControl:
         )
         self.logger = logging.getLogger('HybridMonitorControl')
 
-    def detect_monitors(self) -> Dict[str, Dict[str, Any]]:
-        """Detect monitors using KDE interface (preferred) with DDC fallback"""
+    def detect_monitors(self, force: bool = False) -> Dict[str, Dict[str, Any]]:
+        """Detect monitors using KDE interface (preferred) with DDC fallback.
+
+        Results are cached for a short TTL; pass force=True to re-probe
+        (e.g. from a periodic refresh or after a hotplug event).
+        """
+        if (not force and self.monitors
+                and time.monotonic() - self._detect_cache_time < self._detect_cache_ttl):
+            return self.monitors
+
         monitors = {}
 
         # Try KDE first - it can see all monitors
@@ -669,6 +849,7 @@ class HybridMonitorControl:
             self.logger.info(f"Found {len(raw_monitors)} additional monitor(s) via raw I2C probe")
 
         self.monitors = monitors
+        self._detect_cache_time = time.monotonic()
         return monitors
 
     def get_brightness(self, monitor_id: str) -> Optional[int]:
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""Shared settings frame for the tkinter front ends."""
+
+import tkinter as tk
+from tkinter import ttk
+
+# Shared font descriptors - one tuple each instead of a fresh literal
+# per widget, so Tk resolves each descriptor once
+_FONT_TITLE = ('Arial', 14, 'bold')
+_FONT_LABEL = ('Arial', 10)
+_FONT_VALUE = ('Arial', 10, 'bold')
+_FONT_STATUS = ('Arial', 9)
+
+# Screen size cached after the first query - winfo_screenwidth/height
+# round-trip to the display server on every call
+_SCREEN = [None]
+
+
+def screen_wh(tk_widget):
+    """(width, height) of the screen, queried once per process"""
+    if _SCREEN[0] is None:
+        _SCREEN[0] = (tk_widget.winfo_screenwidth(),
+                      tk_widget.winfo_screenheight())
+    return _SCREEN[0]
+
+
+class SettingsFrame:
+    """Night/day brightness sliders with apply/restart/close buttons.
+
+    One implementation for brightness_panel and brightness_tray, which
+    previously carried character-for-character copies of this layout,
+    the slider callbacks and the status label.
+    """
+
+    def __init__(self, window, config, on_apply, on_restart, on_close):
+        self.window = window
+
+        # One frame, one grid: every row-wrapper frame the old layout
+        # used just to pack(side=LEFT) was a full Tk widget the geometry
+        # solver had to revisit on each redraw
+        main_frame = ttk.Frame(window, padding="20")
+        main_frame.pack(fill=tk.BOTH, expand=True)
+
+        # Title
+        ttk.Label(main_frame, text="🔆 Auto Brightness Settings",
+                  font=_FONT_TITLE).grid(row=0, column=0, columnspan=3,
+                                         pady=(0, 20))
+
+        # Sliders
+        ttk.Label(main_frame, text="🌙 Night Brightness:",
+                  font=_FONT_LABEL).grid(row=1, column=0, sticky=tk.W, pady=5)
+
+        # IntVar over DoubleVar + command: the Scale command hands its
+        # position over as a string, costing a float parse per drag
+        # event; the variable trace reads the int straight from Tk
+        self.min_var = tk.IntVar(value=int(config.get("min_brightness", 0.3) * 100))
+        self.min_scale = ttk.Scale(main_frame, from_=10, to=80,
+                                   variable=self.min_var, orient=tk.HORIZONTAL,
+                                   length=180)
+        self.min_scale.grid(row=1, column=1, padx=(10, 5), pady=5)
+
+        self.min_label = ttk.Label(main_frame, text=f"{self.min_var.get()}%",
+                                   font=_FONT_VALUE, width=4)
+        self.min_label.grid(row=1, column=2, pady=5)
+
+        ttk.Label(main_frame, text="☀️ Day Brightness:",
+                  font=_FONT_LABEL).grid(row=2, column=0, sticky=tk.W, pady=5)
+
+        self.max_var = tk.IntVar(value=int(config.get("max_brightness", 1.0) * 100))
+        self.max_scale = ttk.Scale(main_frame, from_=50, to=100,
+                                   variable=self.max_var, orient=tk.HORIZONTAL,
+                                   length=180)
+        self.max_scale.grid(row=2, column=1, padx=(10, 5), pady=5)
+
+        self.max_label = ttk.Label(main_frame, text=f"{self.max_var.get()}%",
+                                   font=_FONT_VALUE, width=4)
+        self.max_label.grid(row=2, column=2, pady=5)
+
+        # Buttons
+        ttk.Button(main_frame, text="✓ Apply Settings",
+                   command=on_apply).grid(row=3, column=0, pady=(15, 0))
+
+        ttk.Button(main_frame, text="🔄 Restart Service",
+                   command=on_restart).grid(row=3, column=1, pady=(15, 0))
+
+        ttk.Button(main_frame, text="✕ Close",
+                   command=on_close).grid(row=3, column=2, pady=(15, 0))
+
+        # Status
+        self.status_label = ttk.Label(main_frame, text="Ready",
+                                      foreground="green", font=_FONT_STATUS)
+        self.status_label.grid(row=4, column=0, columnspan=3, pady=(15, 0))
+
+        # Pending after-ids for the slider debounce
+        self._min_pending = None
+        self._max_pending = None
+
+        self.min_var.trace_add('write', self._on_min_change)
+        self.max_var.trace_add('write', self._on_max_change)
+
+    def _on_min_change(self, *args):
+        # Scales fire once per drag pixel; coalesce to one Tk update per
+        # 60Hz frame via a cancel-and-reschedule after()
+        if self._min_pending is not None:
+            self.window.after_cancel(self._min_pending)
+        self._min_pending = self.window.after(16, self._apply_min_change)
+
+    def _apply_min_change(self):
+        self._min_pending = None
+        val = self.min_var.get()
+        self.min_label.config(text=f"{val}%")
+        if val >= self.max_var.get():
+            # Setting the peer var fires its trace, which retexts its label
+            self.max_var.set(val + 10)
+
+    def _on_max_change(self, *args):
+        if self._max_pending is not None:
+            self.window.after_cancel(self._max_pending)
+        self._max_pending = self.window.after(16, self._apply_max_change)
+
+    def _apply_max_change(self):
+        self._max_pending = None
+        val = self.max_var.get()
+        self.max_label.config(text=f"{val}%")
+        if val <= self.min_var.get():
+            self.min_var.set(val - 10)
+
+    def set_status(self, text, color):
+        self.status_label.config(text=text, foreground=color)